@@ -10,7 +10,9 @@ Run this script with:
     python examples/basic_usage.py
 """
 
+import functools
 import sys
+from itertools import islice
 from pathlib import Path
 
 # Add src to path so we can import ontoguard
@@ -18,11 +20,23 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ontoguard import OntologyValidator, ValidationResult
 from rich.console import Console
+from rich.padding import Padding
 from rich.panel import Panel
 
 # Initialize rich console for beautiful output
-# Configure console to handle encoding issues on Windows
-console = Console(force_terminal=True, legacy_windows=False)
+# Configure console to handle encoding issues on Windows; when output is
+# piped, skip terminal styling and per-print syntax highlighting
+console = Console(force_terminal=sys.stdout.isatty(), legacy_windows=False, highlight=False)
+
+
+# ASCII replacements for emojis used in denial explanations
+_EMOJI_TABLE = str.maketrans({'❌': '[X]', '📋': '[Info]', '💡': '[Tip]'})
+
+
+@functools.lru_cache(maxsize=4)
+def _panel_style(border_color: str) -> dict:
+    """Return the shared Panel style options for a border color."""
+    return {"border_style": border_color, "padding": (1, 2)}
 
 
 def print_result(scenario_name: str, result: ValidationResult, expected: str) -> None:
@@ -51,38 +65,39 @@ def print_result(scenario_name: str, result: ValidationResult, expected: str) ->
     else:
         expectation_status = "[red][X] Unexpected[/red]"
     
-    # Create a panel with the result
-    content = f"""
-{status_icon} Result: {status_text} ({expectation_status})
-
-[bold]Reason:[/bold] {result.reason}
-"""
+    # Collect lines and join once instead of growing a string
+    parts = [
+        f"{status_icon} Result: {status_text} ({expectation_status})",
+        "",
+        f"[bold]Reason:[/bold] {result.reason}",
+    ]
     
     # Add suggested actions if available
     if result.suggested_actions:
-        content += f"\n[bold]Suggested Alternatives:[/bold]\n"
-        for action in result.suggested_actions[:3]:  # Show up to 3
-            content += f"  - {action}\n"
+        parts.append("")
+        parts.append("[bold]Suggested Alternatives:[/bold]")
+        for action in islice(result.suggested_actions, 3):  # Show up to 3
+            parts.append(f"  - {action}")
     
     # Add metadata summary if available
     if result.metadata:
         context = result.metadata.get("context", {})
         if context:
-            content += f"\n[bold]Context:[/bold]\n"
-            for key, value in list(context.items())[:3]:  # Show first 3 context items
-                content += f"  - {key}: {value}\n"
+            parts.append("")
+            parts.append("[bold]Context:[/bold]")
+            for key, value in islice(context.items(), 3):  # Show first 3 context items
+                parts.append(f"  - {key}: {value}")
     
     # Create panel with appropriate border color
     border_color = "green" if matches else "red"
     panel = Panel(
-        content.strip(),
+        "\n".join(parts),
         title=f"[bold]{scenario_name}[/bold]",
-        border_style=border_color,
-        padding=(1, 2)
+        **_panel_style(border_color)
     )
     
-    console.print(panel)
-    console.print()  # Empty line for spacing
+    # Single render pass, with a blank line below for spacing
+    console.print(Padding(panel, (0, 0, 1, 0)))
 
 
 def main():
@@ -252,8 +267,8 @@ def main():
     )
     
     # Remove emoji characters that may cause encoding issues on Windows
-    # Replace common emojis with ASCII equivalents
-    explanation_clean = explanation.replace('❌', '[X]').replace('📋', '[Info]').replace('💡', '[Tip]')
+    # Replace common emojis with ASCII equivalents in a single pass
+    explanation_clean = explanation.translate(_EMOJI_TABLE)
     
     console.print(Panel(
         explanation_clean,
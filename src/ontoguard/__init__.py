@@ -5,8 +5,20 @@ OntoGuard validates agent actions against OWL ontologies to prevent
 business rule violations.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from .validator import OntologyValidator, ValidationResult
+if TYPE_CHECKING:
+    from .validator import OntologyValidator, ValidationResult
 
 __all__ = ["OntologyValidator", "ValidationResult"]
+
+
+def __getattr__(name: str) -> Any:
+    # Load the validator (and with it rdflib/pydantic) only on first access,
+    # so entry points like `python -m ontoguard --help` start quickly.
+    if name in __all__:
+        from . import validator
+        return getattr(validator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,7 +8,15 @@ Instead of:
     python -m ontoguard.cli
 """
 
-from ontoguard.cli import cli
+import sys
+
+from ontoguard import __version__
 
 if __name__ == '__main__':
+    # Answer --version without importing click and the CLI module
+    if len(sys.argv) == 2 and sys.argv[1] == '--version':
+        print(f"ontoguard, version {__version__}")
+        sys.exit(0)
+
+    from ontoguard.cli import cli
     cli()
@@ -4,32 +4,125 @@ Command-line interface for OntoGuard.
 This module provides CLI commands for validating actions against OWL ontologies.
 """
 
+import functools
+import json
+import os
+import re
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.text import Text
-from rdflib.namespace import RDF, RDFS, OWL
 
-from ontoguard import OntologyValidator, ValidationResult
+from ontoguard import __version__
 
-# Initialize rich console
-console = Console()
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
 
+# rich, rdflib and the validator are imported inside the functions that use
+# them so that `ontoguard --help` does not pay for loading them.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from ontoguard import OntologyValidator, ValidationResult
 
-def print_validation_result(result: ValidationResult, show_metadata: bool = False) -> None:
+# Keywords that mark a class label as an action (matched case-insensitively
+# so labels need not be lowercased first)
+_ACTION_RE = re.compile(r'action|create|delete|modify|process|cancel', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Return the shared rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def _parse_json(text: str) -> Any:
+    """
+    Parse a JSON string, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+            (orjson's decode error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _local_name(uri: str) -> str:
+    """Return the part of a URI after the last '#' or '/'."""
+    return uri.rpartition('#')[2].rpartition('/')[2]
+
+
+def _resolve_format(output_format: Optional[str]) -> str:
+    """Pick the output format: rich on a terminal, tsv when stdout is piped."""
+    if output_format:
+        return output_format
+    return "rich" if sys.stdout.isatty() else "tsv"
+
+
+format_option = click.option(
+    '--format', 'output_format', type=click.Choice(['rich', 'tsv', 'json']), default=None,
+    help='Output format (default: rich on a terminal, tsv when piped)'
+)
+
+
+# Directory for pickled validators of previously parsed ontologies
+CACHE_DIR = Path(os.getenv("ONTOGUARD_CACHE_DIR", Path.home() / ".cache" / "ontoguard"))
+
+
+def _load_validator(ontology_file: Path, use_cache: bool = True) -> "OntologyValidator":
+    """
+    Load an OntologyValidator, reusing the parse from earlier runs.
+
+    See OntologyValidator.load_cached; validators are cached under CACHE_DIR.
+
+    Args:
+        ontology_file: Path to the OWL ontology file
+        use_cache: Whether to read from and write to the validator cache
+
+    Returns:
+        Loaded OntologyValidator instance
+    """
+    from ontoguard import OntologyValidator
+
+    if not use_cache:
+        return OntologyValidator(str(ontology_file))
+
+    return OntologyValidator.load_cached(str(ontology_file), CACHE_DIR)
+
+
+def print_validation_result(result: "ValidationResult", show_metadata: bool = False,
+                            output_format: str = "rich") -> None:
     """
     Print a validation result in a nice format.
     
     Args:
         result: The ValidationResult to display
         show_metadata: Whether to show detailed metadata
+        output_format: "rich" for a panel, "tsv" or "json" for plain output
     """
+    # Plain formats skip rich's layout work entirely
+    if output_format == "tsv":
+        click.echo(f"{'ALLOW' if result.allowed else 'DENY'}\t{result.reason}")
+        return
+    if output_format == "json":
+        click.echo(json.dumps({
+            "allowed": result.allowed,
+            "reason": result.reason,
+            "suggested_actions": result.suggested_actions,
+            "metadata": result.metadata
+        }, default=str))
+        return
+
+    from rich.panel import Panel
+
+    console = _get_console()
+
     # Determine status color and icon (using ASCII-safe characters)
     if result.allowed:
         status_color = "green"
@@ -46,7 +139,7 @@ def print_validation_result(result: ValidationResult, show_metadata: bool = Fals
     # Add suggested actions if available
     if result.suggested_actions:
         content += f"\n\n[bold]Suggested Alternatives:[/bold]"
-        for action in result.suggested_actions[:5]:  # Limit to 5
+        for action in islice(result.suggested_actions, 5):  # Limit to 5
             content += f"\n  - {action}"
     
     # Add metadata if requested
@@ -54,7 +147,7 @@ def print_validation_result(result: ValidationResult, show_metadata: bool = Fals
         content += f"\n\n[bold]Metadata:[/bold]"
         context = result.metadata.get("context", {})
         if context:
-            for key, value in list(context.items())[:5]:  # Show first 5
+            for key, value in islice(context.items(), 5):  # Show first 5
                 content += f"\n  - {key}: {value}"
     
     panel = Panel(
@@ -67,7 +160,7 @@ def print_validation_result(result: ValidationResult, show_metadata: bool = Fals
 
 
 @click.group()
-@click.version_option(version="0.1.0", prog_name="ontoguard")
+@click.version_option(version=__version__, prog_name="ontoguard")
 def cli():
     """
     OntoGuard - Semantic Firewall for AI Agents
@@ -86,8 +179,13 @@ def cli():
 @click.option('--role', '-r', help='User role (e.g., "Admin", "Customer")')
 @click.option('--context', '-c', help='Additional context as JSON string (optional)')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed metadata')
+@click.option('--no-cache', is_flag=True, help='Parse the ontology without using the validator cache')
+@click.option('--via', type=click.Path(path_type=Path),
+              help="Send the request to an 'ontoguard serve' socket instead of loading the ontology")
+@format_option
 def validate(ontology_file: Path, action: str, entity: str, entity_id: str, 
-             role: Optional[str], context: Optional[str], verbose: bool):
+             role: Optional[str], context: Optional[str], verbose: bool, no_cache: bool,
+             via: Optional[Path], output_format: Optional[str]):
     """
     Validate a single action against an ontology.
     
@@ -99,40 +197,58 @@ def validate(ontology_file: Path, action: str, entity: str, entity_id: str,
         ontoguard validate ecommerce.owl --action "create order" --entity "Order" --role "Customer"
         
         ontoguard validate ecommerce.owl -a "delete user" -e "User" -r "Admin" -v
+        
+        ontoguard validate ecommerce.owl -a "create" -e "Order" -r "Customer" --via /tmp/ontoguard.sock
     """
+    console = _get_console()
+    output_format = _resolve_format(output_format)
+    show_progress = output_format == "rich"
+
     try:
-        # Load ontology
-        console.print(f"[cyan]Loading ontology from:[/cyan] {ontology_file}")
-        validator = OntologyValidator(str(ontology_file))
-        console.print(f"[green][OK][/green] Loaded {len(validator.graph)} triples\n")
-        
         # Parse context
         context_dict: Dict[str, Any] = {}
         if role:
             context_dict['role'] = role
         if context:
             try:
-                import json
-                context_dict.update(json.loads(context))
+                context_dict.update(_parse_json(context))
             except json.JSONDecodeError:
                 console.print(f"[red]Error:[/red] Invalid JSON in --context option")
                 sys.exit(1)
         
+        # Load ontology (a running server has already loaded its own)
+        validator = None
+        if not via:
+            if show_progress:
+                console.print(f"[cyan]Loading ontology from:[/cyan] {ontology_file}")
+            validator = _load_validator(ontology_file, use_cache=not no_cache)
+            if show_progress:
+                console.print(f"[green][OK][/green] Loaded {validator.triple_count} triples\n")
+        
         # Validate action
-        console.print(f"[cyan]Validating action:[/cyan] {action}")
-        console.print(f"[cyan]Entity:[/cyan] {entity} (ID: {entity_id or 'N/A'})")
-        if context_dict:
-            console.print(f"[cyan]Context:[/cyan] {context_dict}\n")
+        if show_progress:
+            console.print(f"[cyan]Validating action:[/cyan] {action}")
+            console.print(f"[cyan]Entity:[/cyan] {entity} (ID: {entity_id or 'N/A'})")
+            if context_dict:
+                console.print(f"[cyan]Context:[/cyan] {context_dict}\n")
         
-        result = validator.validate(
-            action=action,
-            entity=entity,
-            entity_id=entity_id,
-            context=context_dict
-        )
+        if via:
+            result = _validate_via_socket(via, {
+                "action": action,
+                "entity": entity,
+                "entity_id": entity_id,
+                "context": context_dict
+            })
+        else:
+            result = validator.validate(
+                action=action,
+                entity=entity,
+                entity_id=entity_id,
+                context=context_dict
+            )
         
         # Display result
-        print_validation_result(result, show_metadata=verbose)
+        print_validation_result(result, show_metadata=verbose, output_format=output_format)
         
         # Exit with appropriate code
         sys.exit(0 if result.allowed else 1)
@@ -151,24 +267,77 @@ def validate(ontology_file: Path, action: str, entity: str, entity_id: str,
         sys.exit(1)
 
 
+def _enable_completion(validator: "OntologyValidator") -> None:
+    """
+    Turn on line editing, history and Tab completion for the REPL prompts.
+
+    input() picks these up from the readline module once it is imported.
+    Completion words are the ontology's class and action names plus the
+    REPL commands. Does nothing where readline is unavailable (Windows).
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+
+    from rdflib.namespace import OWL
+
+    validator._build_indices()
+    words = {_local_name(str(cls)) for cls in validator._by_type.get(OWL.Class, [])}
+    words.update(validator._known_actions)
+    words.update(['exit', 'quit', 'help', 'info'])
+    words = sorted(words)
+
+    def complete(text: str, state: int) -> Optional[str]:
+        text_lower = text.lower()
+        matches = [w for w in words if w.lower().startswith(text_lower)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.set_completer_delims(' \t')
+    readline.parse_and_bind('tab: complete')
+
+
 @cli.command()
 @click.argument('ontology_file', type=click.Path(exists=True, path_type=Path))
-def interactive(ontology_file: Path):
+@click.option('--no-cache', is_flag=True, help='Parse the ontology without using the validator cache')
+@click.option('--batch', is_flag=True, help='Read JSON requests from stdin, one per line, and write JSON results')
+def interactive(ontology_file: Path, no_cache: bool, batch: bool):
     """
     Start an interactive REPL for testing actions.
     
     Allows you to test multiple actions against the ontology without
     restarting the validator. Type 'exit' or 'quit' to end the session.
     
+    With --batch, each stdin line is a JSON object with "action", "entity"
+    and optional "entity_id", "role" and "context" keys; one JSON result
+    is written to stdout per line.
+    
     Example:
     
         ontoguard interactive ecommerce.owl
+        
+        cat scenarios.jsonl | ontoguard interactive ecommerce.owl --batch
     """
+    from rich.panel import Panel
+
+    console = _get_console()
+
+    if batch:
+        try:
+            validator = _load_validator(ontology_file, use_cache=not no_cache)
+        except Exception as e:
+            click.echo(f"Error: Failed to load ontology: {e}", err=True)
+            sys.exit(1)
+        _run_batch(validator)
+        return
+
     try:
         # Load ontology
         console.print(f"[cyan]Loading ontology from:[/cyan] {ontology_file}")
-        validator = OntologyValidator(str(ontology_file))
-        console.print(f"[green][OK][/green] Loaded {len(validator.graph)} triples\n")
+        validator = _load_validator(ontology_file, use_cache=not no_cache)
+        console.print(f"[green][OK][/green] Loaded {validator.triple_count} triples\n")
+        _enable_completion(validator)
         
         console.print(Panel.fit(
             "[bold cyan]OntoGuard Interactive Mode[/bold cyan]\n"
@@ -181,7 +350,7 @@ def interactive(ontology_file: Path):
         while True:
             try:
                 # Prompt for action
-                action = Prompt.ask("[bold cyan]Action[/bold cyan]", default="").strip()
+                action = input("Action: ").strip()
                 if not action or action.lower() in ['exit', 'quit', 'q']:
                     console.print("[yellow]Exiting interactive mode...[/yellow]")
                     break
@@ -200,16 +369,16 @@ def interactive(ontology_file: Path):
                     continue
                 
                 # Prompt for entity
-                entity = Prompt.ask("[bold cyan]Entity Type[/bold cyan]", default="").strip()
+                entity = input("Entity Type: ").strip()
                 if not entity:
                     console.print("[yellow]Skipping validation (no entity provided)[/yellow]\n")
                     continue
                 
                 # Prompt for entity ID (optional)
-                entity_id = Prompt.ask("[bold cyan]Entity ID[/bold cyan] (optional)", default="").strip()
+                entity_id = input("Entity ID (optional): ").strip()
                 
                 # Prompt for role (optional)
-                role = Prompt.ask("[bold cyan]Role[/bold cyan] (optional)", default="").strip()
+                role = input("Role (optional): ").strip()
                 
                 # Build context
                 context: Dict[str, Any] = {}
@@ -219,10 +388,10 @@ def interactive(ontology_file: Path):
                 # Additional context fields
                 console.print("[dim]Enter additional context fields (press Enter to skip):[/dim]")
                 while True:
-                    key = Prompt.ask("  [dim]Context key[/dim] (or Enter to finish)", default="").strip()
+                    key = input("  Context key (or Enter to finish): ").strip()
                     if not key:
                         break
-                    value = Prompt.ask(f"  [dim]Value for '{key}'[/dim]")
+                    value = input(f"  Value for '{key}': ")
                     context[key] = value
                 
                 # Validate
@@ -256,10 +425,202 @@ def interactive(ontology_file: Path):
         sys.exit(1)
 
 
+def _handle_request(validator: "OntologyValidator", line: str) -> Dict[str, Any]:
+    """
+    Validate a single JSON-encoded request.
+
+    The request is a JSON object with "action", "entity" and optional
+    "entity_id", "role" and "context" keys.
+
+    Args:
+        validator: The OntologyValidator instance
+        line: JSON text of the request
+
+    Returns:
+        The validation result as a dictionary, or a dictionary with an
+        "error" key if the request could not be processed
+    """
+    try:
+        request = _parse_json(line)
+        context = dict(request.get("context") or {})
+        if request.get("role"):
+            context["role"] = request["role"]
+        result = validator.validate(
+            action=request["action"],
+            entity=request["entity"],
+            entity_id=request.get("entity_id", ""),
+            context=context
+        )
+        return result.model_dump()
+    except json.JSONDecodeError as e:
+        return {"error": f"Invalid JSON: {e}"}
+    except KeyError as e:
+        return {"error": f"Missing required field: {e}"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _run_batch(validator: "OntologyValidator") -> None:
+    """
+    Validate JSON requests read line by line from stdin.
+
+    One JSON object with "allowed" and "reason" (or an "error" key) is
+    written to stdout per non-empty input line.
+
+    Args:
+        validator: The OntologyValidator instance
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = _handle_request(validator, line)
+        if "error" not in response:
+            response = {"allowed": response["allowed"], "reason": response["reason"]}
+
+        sys.stdout.write(json.dumps(response) + "\n")
+
+    sys.stdout.flush()
+
+
+def _validate_via_socket(socket_path: Path, request: Dict[str, Any]) -> Any:
+    """
+    Send a validation request to a running `ontoguard serve` process.
+
+    Args:
+        socket_path: Path of the server's Unix domain socket
+        request: Request with "action", "entity", "entity_id" and "context"
+
+    Returns:
+        The validation result, with the same attributes as ValidationResult
+
+    Raises:
+        RuntimeError: If the server cannot be reached or reports an error
+    """
+    import socket
+    from types import SimpleNamespace
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError as e:
+        raise RuntimeError(f"Cannot reach OntoGuard server at {socket_path}: {e}") from e
+
+    if not line:
+        raise RuntimeError(f"OntoGuard server at {socket_path} closed the connection")
+
+    response = _parse_json(line)
+    if "error" in response:
+        raise RuntimeError(response["error"])
+
+    # Attribute access is all print_validation_result needs, so avoid
+    # importing the validator (and rdflib) in the client
+    return SimpleNamespace(**response)
+
+
+def _remove_stale_socket(socket_path: Path) -> Optional[str]:
+    """
+    Delete a socket file left behind by a server that is no longer running.
+
+    Only Unix sockets that refuse connections are removed; anything else at
+    the path is left untouched.
+
+    Args:
+        socket_path: Path the server is about to listen on
+
+    Returns:
+        None if the path is free to bind, otherwise an error message
+    """
+    import socket
+    import stat
+
+    try:
+        mode = socket_path.lstat().st_mode
+    except FileNotFoundError:
+        return None
+
+    if not stat.S_ISSOCK(mode):
+        return f"{socket_path} exists and is not a socket"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return None
+
+    return f"Another server is already listening on {socket_path}"
+
+
+@cli.command()
+@click.argument('ontology_file', type=click.Path(exists=True, path_type=Path))
+@click.option('--socket', '-s', 'socket_path', required=True, type=click.Path(path_type=Path),
+              help='Path of the Unix domain socket to listen on')
+@click.option('--no-cache', is_flag=True, help='Parse the ontology without using the validator cache')
+def serve(ontology_file: Path, socket_path: Path, no_cache: bool):
+    """
+    Serve validation requests for an ontology over a Unix socket.
+    
+    Loads the ontology once and answers newline-delimited JSON requests
+    (same format as 'interactive --batch'), so repeated validations in
+    scripts skip reloading the ontology. Use 'validate --via' as a client.
+    
+    Example:
+    
+        ontoguard serve ecommerce.owl --socket /tmp/ontoguard.sock
+        
+        ontoguard validate ecommerce.owl -a "create" -e "Order" -r "Customer" --via /tmp/ontoguard.sock
+    """
+    import socketserver
+
+    console = _get_console()
+
+    try:
+        console.print(f"[cyan]Loading ontology from:[/cyan] {ontology_file}")
+        validator = _load_validator(ontology_file, use_cache=not no_cache)
+        console.print(f"[green][OK][/green] Loaded {validator.triple_count} triples")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] Failed to load ontology: {e}")
+        sys.exit(1)
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for raw_line in self.rfile:
+                line = raw_line.decode("utf-8").strip()
+                if not line:
+                    continue
+                response = _handle_request(validator, line)
+                self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+    # Remove a stale socket left by a previous run, and nothing else
+    error = _remove_stale_socket(socket_path)
+    if error:
+        console.print(f"[red]Error:[/red] {error}")
+        sys.exit(1)
+
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), RequestHandler)
+    server.daemon_threads = True
+    console.print(f"[cyan]Listening on:[/cyan] {socket_path} (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Shutting down...[/yellow]")
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
 @cli.command()
 @click.argument('ontology_file', type=click.Path(exists=True, path_type=Path))
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed information')
-def info(ontology_file: Path, detailed: bool):
+@click.option('--no-cache', is_flag=True, help='Parse the ontology without using the validator cache')
+@format_option
+def info(ontology_file: Path, detailed: bool, no_cache: bool, output_format: Optional[str]):
     """
     Show information about an ontology.
     
@@ -272,12 +633,16 @@ def info(ontology_file: Path, detailed: bool):
         
         ontoguard info ecommerce.owl --detailed
     """
+    console = _get_console()
+    output_format = _resolve_format(output_format)
+
     try:
         # Load ontology
-        console.print(f"[cyan]Loading ontology from:[/cyan] {ontology_file}")
-        validator = OntologyValidator(str(ontology_file))
+        if output_format == "rich":
+            console.print(f"[cyan]Loading ontology from:[/cyan] {ontology_file}")
+        validator = _load_validator(ontology_file, use_cache=not no_cache)
         
-        _show_ontology_info(validator, detailed=detailed)
+        _show_ontology_info(validator, detailed=detailed, output_format=output_format)
         
     except FileNotFoundError:
         console.print(f"[red]Error:[/red] Ontology file not found: {ontology_file}")
@@ -290,44 +655,64 @@ def info(ontology_file: Path, detailed: bool):
         sys.exit(1)
 
 
-def _show_ontology_info(validator: OntologyValidator, detailed: bool = False) -> None:
+def _show_ontology_info(validator: "OntologyValidator", detailed: bool = False,
+                        output_format: str = "rich") -> None:
     """
     Display ontology information.
     
     Args:
         validator: The OntologyValidator instance
         detailed: Whether to show detailed information
+        output_format: "rich" for tables, "tsv" or "json" for plain output
     """
-    graph = validator.graph
-    if not graph:
+    from rdflib.namespace import OWL
+
+    console = _get_console()
+
+    # Everything below comes from the graph indices and counts, so a
+    # validator restored from the cache never has to re-parse its graph
+    triple_count = validator.triple_count
+    if not validator._loaded or not triple_count:
         console.print("[red]Error:[/red] Ontology graph is not loaded")
         return
     
-    console.print(f"[green][OK][/green] Loaded {len(graph)} triples\n")
+    # Bucket subjects by rdf:type and collect labels in a single graph pass
+    validator._build_indices()
+    by_type = validator._by_type
+    labels = validator._labels
+    extra_labels = validator._extra_labels
     
-    # Summary statistics
-    summary_table = Table(title="[bold]Ontology Summary[/bold]", show_header=True, header_style="bold cyan")
-    summary_table.add_column("Metric", style="cyan")
-    summary_table.add_column("Count", style="green")
-    
-    # Count classes
-    classes = list(graph.subjects(RDF.type, OWL.Class))
-    summary_table.add_row("Classes", str(len(classes)))
+    classes = by_type.get(OWL.Class, [])
+    object_props = by_type.get(OWL.ObjectProperty, [])
+    datatype_props = by_type.get(OWL.DatatypeProperty, [])
     
-    # Count object properties
-    object_props = list(graph.subjects(RDF.type, OWL.ObjectProperty))
-    summary_table.add_row("Object Properties", str(len(object_props)))
+    summary = [
+        ("Classes", len(classes)),
+        ("Object Properties", len(object_props)),
+        ("Datatype Properties", len(datatype_props)),
+        ("Individuals", validator._typed_subject_count),
+        ("Total Triples", triple_count),
+    ]
     
-    # Count datatype properties
-    datatype_props = list(graph.subjects(RDF.type, OWL.DatatypeProperty))
-    summary_table.add_row("Datatype Properties", str(len(datatype_props)))
+    if output_format != "rich":
+        sections = {
+            "class": classes,
+            "object_property": object_props,
+            "datatype_property": datatype_props,
+        } if detailed else {}
+        _print_plain_info(summary, sections, labels, output_format)
+        return
     
-    # Count individuals
-    individuals = list(graph.subjects(RDF.type, None))
-    summary_table.add_row("Individuals", str(len(set(individuals))))
+    from rich.table import Table
+
+    console.print(f"[green][OK][/green] Loaded {triple_count} triples\n")
     
-    # Count triples
-    summary_table.add_row("Total Triples", str(len(graph)))
+    # Summary statistics
+    summary_table = Table(title="[bold]Ontology Summary[/bold]", show_header=True, header_style="bold cyan")
+    summary_table.add_column("Metric", style="cyan")
+    summary_table.add_column("Count", style="green")
+    for metric, count in summary:
+        summary_table.add_row(metric, str(count))
     
     console.print(summary_table)
     console.print()
@@ -339,10 +724,9 @@ def _show_ontology_info(validator: OntologyValidator, detailed: bool = False) ->
             classes_table.add_column("Class", style="cyan")
             classes_table.add_column("Label", style="white")
             
-            for cls in classes[:20]:  # Limit to 20 for display
-                labels = list(graph.objects(cls, RDFS.label))
-                label = str(labels[0]) if labels else str(cls).split('#')[-1].split('/')[-1]
-                cls_name = str(cls).split('#')[-1].split('/')[-1]
+            for cls in islice(classes, 20):  # Limit to 20 for display
+                cls_name = _local_name(str(cls))
+                label = labels.get(cls) or cls_name
                 classes_table.add_row(cls_name, label)
             
             if len(classes) > 20:
@@ -357,10 +741,9 @@ def _show_ontology_info(validator: OntologyValidator, detailed: bool = False) ->
             props_table.add_column("Property", style="cyan")
             props_table.add_column("Label", style="white")
             
-            for prop in object_props[:20]:  # Limit to 20
-                labels = list(graph.objects(prop, RDFS.label))
-                label = str(labels[0]) if labels else str(prop).split('#')[-1].split('/')[-1]
-                prop_name = str(prop).split('#')[-1].split('/')[-1]
+            for prop in islice(object_props, 20):  # Limit to 20
+                prop_name = _local_name(str(prop))
+                label = labels.get(prop) or prop_name
                 props_table.add_row(prop_name, label)
             
             if len(object_props) > 20:
@@ -375,10 +758,9 @@ def _show_ontology_info(validator: OntologyValidator, detailed: bool = False) ->
             dt_props_table.add_column("Property", style="cyan")
             dt_props_table.add_column("Label", style="white")
             
-            for prop in datatype_props[:20]:  # Limit to 20
-                labels = list(graph.objects(prop, RDFS.label))
-                label = str(labels[0]) if labels else str(prop).split('#')[-1].split('/')[-1]
-                prop_name = str(prop).split('#')[-1].split('/')[-1]
+            for prop in islice(datatype_props, 20):  # Limit to 20
+                prop_name = _local_name(str(prop))
+                label = labels.get(prop) or prop_name
                 dt_props_table.add_row(prop_name, label)
             
             if len(datatype_props) > 20:
@@ -388,12 +770,17 @@ def _show_ontology_info(validator: OntologyValidator, detailed: bool = False) ->
             console.print()
     
     # Show action-related classes (if any)
+    # Only the first 15 are displayed, so keep those and just count the rest
     action_classes = []
+    action_count = 0
     for cls in classes:
-        labels = list(graph.objects(cls, RDFS.label))
-        for label in labels:
-            label_str = str(label).lower()
-            if 'action' in label_str or any(keyword in label_str for keyword in ['create', 'delete', 'modify', 'process', 'cancel']):
+        # Any label may mark an action (e.g. multilingual labels); stop at the first match
+        first_label = labels.get(cls)
+        cls_labels = ([first_label] if first_label is not None else []) + extra_labels.get(cls, [])
+        label = next((lbl for lbl in cls_labels if _ACTION_RE.search(lbl)), None)
+        if label is not None:
+            action_count += 1
+            if len(action_classes) < 15:
                 action_classes.append((cls, label))
     
     if action_classes:
@@ -401,16 +788,52 @@ def _show_ontology_info(validator: OntologyValidator, detailed: bool = False) ->
         actions_table.add_column("Action Class", style="cyan")
         actions_table.add_column("Label", style="white")
         
-        for cls, label in action_classes[:15]:  # Limit to 15
-            cls_name = str(cls).split('#')[-1].split('/')[-1]
+        for cls, label in action_classes:
+            cls_name = _local_name(str(cls))
             actions_table.add_row(cls_name, str(label))
         
-        if len(action_classes) > 15:
-            actions_table.add_row("...", f"[dim](and {len(action_classes) - 15} more)[/dim]")
+        if action_count > 15:
+            actions_table.add_row("...", f"[dim](and {action_count - 15} more)[/dim]")
         
         console.print(actions_table)
         console.print()
 
 
+def _print_plain_info(
+    summary: List[Tuple[str, int]],
+    sections: Dict[str, List[Any]],
+    labels: Dict[Any, str],
+    output_format: str
+) -> None:
+    """
+    Print ontology information as tab-separated lines or a JSON object.
+    
+    Args:
+        summary: (metric, count) pairs
+        sections: Kind of resource (e.g. "class") -> resources to list
+        labels: Resource -> rdfs:label lookup
+        output_format: "tsv" or "json"
+    """
+    def key(metric: str) -> str:
+        return metric.lower().replace(' ', '_')
+
+    entries = {
+        kind: [(_local_name(str(res)), labels.get(res) or _local_name(str(res))) for res in resources]
+        for kind, resources in sections.items()
+    }
+
+    if output_format == "json":
+        data: Dict[str, Any] = {key(metric): count for metric, count in summary}
+        for kind, rows in entries.items():
+            data[f"{kind}_list"] = [{"name": name, "label": label} for name, label in rows]
+        click.echo(json.dumps(data))
+        return
+
+    lines = [f"{key(metric)}\t{count}" for metric, count in summary]
+    for kind, rows in entries.items():
+        lines.extend(f"{kind}\t{name}\t{label}" for name, label in rows)
+    click.echo("\n".join(lines))
+
+
 if __name__ == '__main__':
     cli()
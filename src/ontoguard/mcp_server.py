@@ -22,11 +22,19 @@ Usage:
     }
 """
 
+import copy
+import difflib
+import functools
+import json
 import logging
 import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-import json
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 try:
     from fastmcp import FastMCP
@@ -42,7 +50,16 @@ except ImportError:
         "PyYAML is required for config loading. Install with: pip install pyyaml"
     )
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF, RDFS
+
 from ontoguard import OntologyValidator, ValidationResult
+from ontoguard.validator import _uri_fragment
 
 # Configure logging
 logging.basicConfig(
@@ -53,8 +70,41 @@ logger = logging.getLogger(__name__)
 
 # Global validator instance
 _validator: Optional[OntologyValidator] = None
+_validator_lock = threading.Lock()
 _config: Dict[str, Any] = {}
 
+# Shared bulk-validation thread pool and its size (see _bulk_executor);
+# created and replaced under _validator_lock
+_bulk_pool: Optional[ThreadPoolExecutor] = None
+_bulk_pool_workers = 0
+
+# Bounded LRU cache of validate_action responses (enabled by cache_validations)
+DEFAULT_VALIDATION_CACHE_SIZE = 256
+_validation_cache: "OrderedDict[Tuple[str, str, str, Union[bytes, str]], Dict[str, Any]]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+# Roles recognised in denial reasons when check_permissions infers required
+# roles (override with known_roles in config.yaml)
+DEFAULT_KNOWN_ROLES = ("admin", "manager", "customer", "doctor", "nurse")
+
+
+# Use libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file.
+    
+    Cached on (path, mtime_ns), so repeated loads of an unchanged file skip
+    the disk read and parse, while an edited file is parsed again.
+    """
+    # Hand the raw bytes to the loader; it detects and decodes UTF-8/16 itself
+    config = yaml.load(Path(path).read_bytes(), Loader=_YAML_LOADER)
+    
+    return config if config is not None else {}
+
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -95,22 +145,20 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
             f"Config file not found. Please create config.yaml or set ONTOGUARD_CONFIG env var."
         )
     
-    logger.info(f"Loading configuration from: {config_path}")
+    logger.info("Loading configuration from: %s", config_path)
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        # Callers modify the returned dict, so never hand out the cached one
+        config = copy.deepcopy(_read_yaml(str(Path(config_path).resolve()), mtime_ns))
         
-        if config is None:
-            config = {}
-        
-        logger.info(f"Configuration loaded successfully")
+        logger.info("Configuration loaded successfully")
         return config
     except yaml.YAMLError as e:
-        logger.error(f"Error parsing YAML config: {e}")
+        logger.error("Error parsing YAML config: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Error loading config: {e}")
+        logger.error("Error loading config: %s", e)
         raise
 
 
@@ -118,6 +166,9 @@ def initialize_validator() -> OntologyValidator:
     """
     Initialize the OntologyValidator from configuration.
     
+    Tool implementations use the module-level validator directly once it is
+    set (``_validator or initialize_validator()``) and only call this to load it.
+    
     Returns:
         Initialized OntologyValidator instance
     
@@ -130,46 +181,274 @@ def initialize_validator() -> OntologyValidator:
     if _validator is not None:
         return _validator
     
-    ontology_path = _config.get("ontology_path")
-    if not ontology_path:
-        raise ValueError(
-            "ontology_path not specified in config.yaml. "
-            "Please set ontology_path in your configuration."
-        )
+    # Concurrent first calls must not each parse the ontology
+    with _validator_lock:
+        if _validator is not None:
+            return _validator
+        
+        ontology_path = _config.get("ontology_path")
+        if not ontology_path:
+            raise ValueError(
+                "ontology_path not specified in config.yaml. "
+                "Please set ontology_path in your configuration."
+            )
+        
+        ontology_path = Path(ontology_path)
+        if not ontology_path.is_absolute():
+            # Try relative to config file location
+            config_file = Path(_config.get("_config_file", "."))
+            ontology_path = config_file.parent / ontology_path
+        
+        if not ontology_path.exists():
+            raise FileNotFoundError(
+                f"Ontology file not found: {ontology_path}. "
+                "Please check ontology_path in config.yaml"
+            )
+        
+        logger.info("Initializing validator with ontology: %s", ontology_path)
+        
+        try:
+            cache_dir = _config.get("validator_cache_dir")
+            if cache_dir:
+                # Reuse the parsed rules of an identical file from an earlier start;
+                # entries written by another OntoGuard version are rebuilt
+                validator = OntologyValidator.load_cached(str(ontology_path), Path(cache_dir).expanduser())
+            else:
+                validator = OntologyValidator(str(ontology_path))
+            # Cached results belong to the previous ontology
+            clear_validation_cache()
+            _validator = validator
+            logger.info("Validator initialized successfully")
+            return _validator
+        except Exception as e:
+            logger.error("Failed to initialize validator: %s", e)
+            raise
+
+
+@functools.lru_cache(maxsize=1)
+def _explain_query():
+    """
+    Parse the explain_rule label search once and reuse it.
+
+    The search term is passed as the ?needle binding, so user input is never
+    spliced into the query text.
+    """
+    from rdflib.plugins.sparql import prepareQuery
+
+    return prepareQuery(
+        """
+        SELECT DISTINCT ?subject ?label ?comment ?type
+        WHERE {
+            ?subject rdfs:label ?label .
+            FILTER(CONTAINS(LCASE(STR(?label)), ?needle))
+            OPTIONAL { ?subject rdfs:comment ?comment }
+            OPTIONAL { ?subject rdf:type ?type }
+        }
+        LIMIT 5
+        """,
+        initNs={"rdf": RDF, "rdfs": RDFS}
+    )
+
+
+def warm_up_validator(validator: OntologyValidator) -> None:
+    """
+    Pay one-time costs up front so the first tool call is not slow.
+
+    Builds the validator's graph indices, prepares the explain_rule SPARQL
+    query (and runs it if the graph is in memory), and validates one action
+    taken from the ontology's own rules. Failures are logged and otherwise
+    ignored.
+    """
+    try:
+        validator._build_indices()
+        query = _explain_query()
+        # A validator restored from the cache has no graph until one is read;
+        # re-parsing it here would undo the cached start
+        if validator._graph is not None:
+            list(validator.graph.query(query, initBindings={"needle": Literal("warmup")}))
+        if validator._parsed_rules:
+            rule = validator._parsed_rules[0]
+            validator.validate(
+                action=rule.action or "read",
+                entity=rule.entity or "Thing",
+                entity_id="warmup",
+                context={"role": rule.role or "Admin"}
+            )
+        logger.info("Validator warm-up complete")
+    except Exception as e:
+        logger.warning("Validator warm-up failed: %s", e)
+
+
+@functools.lru_cache(maxsize=8)
+def _role_pattern(roles: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a case-insensitive whole-word pattern matching any of the roles."""
+    alternation = "|".join(re.escape(role) for role in roles)
+    return re.compile(rf"\b({alternation})\b", re.IGNORECASE)
+
+
+def _bulk_executor(workers: int) -> ThreadPoolExecutor:
+    """
+    Shared thread pool for bulk validation (created on first use).
     
-    ontology_path = Path(ontology_path)
-    if not ontology_path.is_absolute():
-        # Try relative to config file location
-        config_file = Path(_config.get("_config_file", "."))
-        ontology_path = config_file.parent / ontology_path
+    A pool of another size is shut down and replaced; calls already
+    mapped onto it still run to completion. Only useful with graph stores
+    that release the GIL, such as native HDT or database backends; the
+    default in-memory store is pure Python, which is why workers defaults to 1.
+    """
+    global _bulk_pool, _bulk_pool_workers
     
-    if not ontology_path.exists():
-        raise FileNotFoundError(
-            f"Ontology file not found: {ontology_path}. "
-            "Please check ontology_path in config.yaml"
-        )
+    with _validator_lock:
+        if _bulk_pool is None or _bulk_pool_workers != workers:
+            if _bulk_pool is not None:
+                _bulk_pool.shutdown(wait=False)
+            _bulk_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ontoguard-bulk")
+            _bulk_pool_workers = workers
+        return _bulk_pool
+
+
+def _canonical_arg(value: Any) -> Any:
+    """
+    Canonicalize a tool argument at the MCP boundary.
     
-    logger.info(f"Initializing validator with ontology: {ontology_path}")
+    Surrounding whitespace is dropped, so padded variants of the same request
+    share a validation cache entry, and the result is interned to make the
+    validator's repeated dict lookups on it cheaper. Case is preserved because
+    responses echo the caller's spelling; the validator lowercases internally.
+    Non-string values are returned unchanged so the tool's own error handling
+    reports them.
+    """
+    if not isinstance(value, str):
+        return value
+    return sys.intern(value.strip())
+
+
+def clear_validation_cache() -> None:
+    """Drop all cached validate_action responses."""
+    with _validation_cache_lock:
+        _validation_cache.clear()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    """Return a cached value (or None) and mark it most recently used."""
+    with _validation_cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Store a value, evicting least recently used entries over capacity."""
+    max_size = _config.get("validation_cache_size", DEFAULT_VALIDATION_CACHE_SIZE)
+    with _validation_cache_lock:
+        cache[key] = value
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _context_key(context: Dict[str, Any]) -> Union[bytes, str]:
+    """
+    Canonicalize a context dict as sorted-key JSON for use in cache keys.
     
-    try:
-        _validator = OntologyValidator(str(ontology_path))
-        logger.info("Validator initialized successfully")
-        return _validator
-    except Exception as e:
-        logger.error(f"Failed to initialize validator: {e}")
-        raise
+    Uses orjson when it is installed, falling back to the json module for
+    values orjson rejects (e.g. integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                context,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str
+            )
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(context, sort_keys=True, default=str)
+
+
+def _validation_cache_key(
+    action: str,
+    entity: str,
+    entity_id: str,
+    context: Dict[str, Any]
+) -> Tuple[str, str, str, Union[bytes, str]]:
+    """Build a hashable cache key from the request arguments."""
+    return (action, entity, entity_id, _context_key(context))
 
 
 # Initialize FastMCP server
 mcp = FastMCP("OntoGuard")
 
 
+def _error_response(reason: str, error: str, **metadata: Any) -> Dict[str, Any]:
+    """Build the denied validate_action response used for every error path."""
+    return {
+        "allowed": False,
+        "reason": reason,
+        "suggested_actions": [],
+        "metadata": {"error": error, **metadata}
+    }
+
+
+def _validate_one(
+    validator: OntologyValidator,
+    action: str,
+    entity: str,
+    entity_id: str,
+    context: Dict[str, Any],
+    compact: bool = False
+) -> Dict[str, Any]:
+    """
+    Validate a single action and return the tool response dict.
+    
+    Consults the validation cache when cache_validations is enabled.
+    With compact=True only "allowed" and "reason" are returned.
+    Exceptions from the validator propagate to the caller.
+    """
+    use_cache = _config.get("cache_validations", False)
+    if use_cache:
+        cache_key = _validation_cache_key(action, entity, entity_id, context)
+        cached = _cache_get(_validation_cache, cache_key)
+        if cached is not None:
+            logger.debug("Validation cache hit")
+            if compact:
+                return {"allowed": cached["allowed"], "reason": cached["reason"]}
+            return copy.deepcopy(cached)
+    
+    # Validate the action
+    result: ValidationResult = validator.validate(
+        action=action,
+        entity=entity,
+        entity_id=entity_id,
+        context=context
+    )
+    
+    # Convert ValidationResult to dict
+    response = {
+        "allowed": result.allowed,
+        "reason": result.reason,
+        "suggested_actions": result.suggested_actions,
+        "metadata": result.metadata
+    }
+    
+    if compact:
+        # The full response is not handed out, so it can be cached as is
+        if use_cache:
+            _cache_put(_validation_cache, cache_key, response)
+        return {"allowed": result.allowed, "reason": result.reason}
+    
+    if use_cache:
+        _cache_put(_validation_cache, cache_key, copy.deepcopy(response))
+    
+    return response
+
+
 # Define tool functions (will be decorated)
 def _validate_action_impl(
     action: str,
     entity: str,
     entity_id: str,
-    context: Dict[str, Any]
+    context: Dict[str, Any],
+    compact: bool = False
 ) -> Dict[str, Any]:
     """
     Validates if an action is semantically allowed by the ontology.
@@ -193,13 +472,16 @@ def _validate_action_impl(
                  - amount: Transaction amount (for financial rules)
                  - timestamp: Time of action (for temporal constraints)
                  - Any other context relevant to your business rules
+        compact: If true, return only "allowed" and "reason" (smaller
+                 responses when suggestions and metadata are not needed)
     
     Returns:
         Dictionary containing:
         - allowed (bool): Whether the action is allowed
         - reason (str): Human-readable explanation
         - suggested_actions (list): Alternative actions that might be allowed
-        - metadata (dict): Additional validation metadata
+          (omitted when compact)
+        - metadata (dict): Additional validation metadata (omitted when compact)
     
     Example:
         {
@@ -212,34 +494,25 @@ def _validate_action_impl(
             }
         }
     """
+    action = _canonical_arg(action)
+    entity = _canonical_arg(entity)
+    
     logger.info(
-        f"Validation request: action='{action}', entity='{entity}', "
-        f"entity_id='{entity_id}', context={context}"
+        "Validation request: action='%s', entity='%s', entity_id='%s', context=%s",
+        action, entity, entity_id, context
     )
     
     try:
-        validator = initialize_validator()
-        
-        # Validate the action
-        result: ValidationResult = validator.validate(
-            action=action,
-            entity=entity,
-            entity_id=entity_id,
-            context=context
-        )
+        validator = _validator or initialize_validator()
         
-        # Convert ValidationResult to dict
-        response = {
-            "allowed": result.allowed,
-            "reason": result.reason,
-            "suggested_actions": result.suggested_actions,
-            "metadata": result.metadata
-        }
+        response = _validate_one(validator, action, entity, entity_id, context, compact)
         
-        log_level = logging.INFO if result.allowed else logging.WARNING
+        log_level = logging.INFO if response["allowed"] else logging.WARNING
         logger.log(
             log_level,
-            f"Validation result: allowed={result.allowed}, reason={result.reason}"
+            "Validation result: allowed=%s, reason=%s",
+            response["allowed"],
+            response["reason"]
         )
         
         return response
@@ -247,30 +520,92 @@ def _validate_action_impl(
     except FileNotFoundError as e:
         error_msg = f"Ontology file not found: {e}"
         logger.error(error_msg)
-        return {
-            "allowed": False,
-            "reason": error_msg,
-            "suggested_actions": [],
-            "metadata": {"error": "ontology_not_found"}
-        }
+        return _error_response(error_msg, "ontology_not_found")
     except ValueError as e:
         error_msg = f"Invalid configuration: {e}"
         logger.error(error_msg)
-        return {
-            "allowed": False,
-            "reason": error_msg,
-            "suggested_actions": [],
-            "metadata": {"error": "configuration_error"}
-        }
+        return _error_response(error_msg, "configuration_error")
     except Exception as e:
         error_msg = f"Validation error: {str(e)}"
         logger.error(error_msg, exc_info=True)
+        return _error_response(error_msg, "validation_error", exception=str(e))
+
+
+def _validate_actions_bulk_impl(
+    requests: List[Dict[str, Any]],
+    compact: bool = False
+) -> Dict[str, Any]:
+    """
+    Validates a list of actions in one call.
+    
+    Use this tool when you need to check several candidate actions before
+    choosing one. Each request is validated exactly like validate_action,
+    but the validator is resolved once and per-request logging is skipped.
+    
+    Args:
+        requests: List of requests, each a dictionary with keys:
+                  - action (str, required): The action to validate
+                  - entity (str, required): The entity type
+                  - entity_id (str, optional): Entity instance identifier
+                  - context (dict, optional): Context such as {"role": "Admin"}
+        compact: If true, each result holds only "allowed" and "reason"
+    
+    Returns:
+        Dictionary containing:
+        - results (list): One validate_action result per request, in order
+        - count (int): Number of results
+        - allowed_count (int): Number of allowed actions
+    
+    Example:
+        {
+            "requests": [
+                {"action": "create order", "entity": "Order", "context": {"role": "Customer"}},
+                {"action": "delete user", "entity": "User", "context": {"role": "Customer"}}
+            ]
+        }
+    """
+    logger.info("Bulk validation request: %d actions", len(requests))
+    
+    try:
+        validator = _validator or initialize_validator()
+    except Exception as e:
+        error_msg = f"Validator not available: {e}"
+        logger.error(error_msg)
         return {
-            "allowed": False,
-            "reason": error_msg,
-            "suggested_actions": [],
-            "metadata": {"error": "validation_error", "exception": str(e)}
+            "results": [],
+            "count": 0,
+            "allowed_count": 0,
+            "error": error_msg
         }
+    
+    def validate_request(request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return _validate_one(
+                validator,
+                _canonical_arg(request["action"]),
+                _canonical_arg(request["entity"]),
+                request.get("entity_id", ""),
+                request.get("context") or {},
+                compact
+            )
+        except Exception as e:
+            error_msg = f"Validation error: {str(e)}"
+            return _error_response(error_msg, "validation_error", exception=str(e))
+    
+    workers = _config.get("workers", 1)
+    if workers > 1 and len(requests) > 1:
+        results = list(_bulk_executor(workers).map(validate_request, requests))
+    else:
+        results = [validate_request(request) for request in requests]
+    
+    allowed_count = sum(1 for r in results if r["allowed"])
+    logger.info("Bulk validation result: %d of %d allowed", allowed_count, len(results))
+    
+    return {
+        "results": results,
+        "count": len(results),
+        "allowed_count": allowed_count
+    }
 
 
 def _get_allowed_actions_impl(
@@ -305,12 +640,15 @@ def _get_allowed_actions_impl(
             "count": 3
         }
     """
-    logger.info(f"Querying allowed actions for entity='{entity}', context={context}")
+    entity = _canonical_arg(entity)
+    
+    logger.info("Querying allowed actions for entity='%s', context=%s", entity, context)
     
     try:
-        validator = initialize_validator()
+        validator = _validator or initialize_validator()
         
-        # Get allowed actions
+        # Get allowed actions (the validator memoizes them per entity and
+        # returns a fresh list each time)
         actions = validator.get_allowed_actions(entity=entity, context=context)
         
         response = {
@@ -320,7 +658,7 @@ def _get_allowed_actions_impl(
             "count": len(actions)
         }
         
-        logger.info(f"Found {len(actions)} allowed actions for entity '{entity}'")
+        logger.info("Found %d allowed actions for entity '%s'", len(actions), entity)
         return response
         
     except RuntimeError as e:
@@ -345,6 +683,47 @@ def _get_allowed_actions_impl(
         }
 
 
+def _describe_action_rule(
+    action_name: str,
+    rule: Dict[str, Any],
+    explanation_parts: List[str],
+    constraints: List[str],
+    applies_to: List[str]
+) -> None:
+    """Append explain_rule output for one parsed action rule."""
+    explanation_parts.append(f"Action: {action_name}")
+
+    if rule.get("requiresRole"):
+        constraints.append(f"Requires role: {rule['requiresRole'].title()}")
+    if rule.get("requiresApproval"):
+        constraints.append(f"Requires approval from: {rule['requiresApproval'].title()}")
+    if rule.get("appliesTo"):
+        applies_to.append(rule["appliesTo"].title())
+        explanation_parts.append(f"Applies to: {rule['appliesTo'].title()}")
+    if rule.get("uri"):
+        explanation_parts.append(f"URI: {rule['uri']}")
+
+
+def _describe_subject(graph: Graph, subject: URIRef, explanation_parts: List[str]) -> None:
+    """Append explain_rule output for one ontology subject."""
+    explanation_parts.append(f"Found: {_uri_fragment(subject)}")
+    explanation_parts.append(f"URI: {subject}")
+
+    # Get rdfs:comment
+    for comment in graph.objects(subject, RDFS.comment):
+        explanation_parts.append(f"Description: {str(comment)}")
+
+    # Get rdfs:label
+    for label in graph.objects(subject, RDFS.label):
+        explanation_parts.append(f"Label: {str(label)}")
+
+    # Get rdf:type
+    for rdf_type in graph.objects(subject, RDF.type):
+        type_name = rdf_type.rpartition('#')[2]
+        if type_name not in ['Class', 'NamedIndividual']:
+            explanation_parts.append(f"Type: {type_name}")
+
+
 def _explain_rule_impl(rule_name: str) -> Dict[str, Any]:
     """
     Explains what a specific business rule means.
@@ -379,10 +758,12 @@ def _explain_rule_impl(rule_name: str) -> Dict[str, Any]:
             "found": true
         }
     """
-    logger.info(f"Explaining rule: {rule_name}")
+    rule_name = _canonical_arg(rule_name)
+
+    logger.info("Explaining rule: %s", rule_name)
 
     try:
-        validator = initialize_validator()
+        validator = _validator or initialize_validator()
 
         if validator.graph is None:
             raise RuntimeError("Ontology not loaded")
@@ -393,79 +774,44 @@ def _explain_rule_impl(rule_name: str) -> Dict[str, Any]:
         found = False
         rule_name_lower = rule_name.lower().strip()
 
-        # Method 1: Check in parsed action rules first
-        if hasattr(validator, '_action_rules') and validator._action_rules:
-            for action_name, rule in validator._action_rules.items():
-                # Match by action name or partial match
-                if (rule_name_lower == action_name or
-                    rule_name_lower in action_name or
-                    action_name in rule_name_lower):
-                    found = True
-                    explanation_parts.append(f"Action: {action_name}")
-
-                    if rule.get("requiresRole"):
-                        constraints.append(f"Requires role: {rule['requiresRole'].title()}")
-                    if rule.get("requiresApproval"):
-                        constraints.append(f"Requires approval from: {rule['requiresApproval'].title()}")
-                    if rule.get("appliesTo"):
-                        applies_to.append(rule["appliesTo"].title())
-                        explanation_parts.append(f"Applies to: {rule['appliesTo'].title()}")
-                    if rule.get("uri"):
-                        explanation_parts.append(f"URI: {rule['uri']}")
-                    break
+        # Method 1: exact action name, then exact URI fragment, so a class,
+        # property or constraint name always resolves to its own URI
+        action_rules = getattr(validator, '_action_rules', None) or {}
+        if rule_name_lower in action_rules:
+            found = True
+            _describe_action_rule(rule_name_lower, action_rules[rule_name_lower],
+                                  explanation_parts, constraints, applies_to)
+        else:
+            subject = validator._match_fragment(rule_name_lower, partial=False)
+            if subject is not None:
+                found = True
+                _describe_subject(validator.graph, subject, explanation_parts)
 
-        # Method 2: Search by URI fragment (partial match)
+        # Method 2: partial action name, then partial URI fragment
         if not found:
-            from rdflib import URIRef, Literal
-            from rdflib.namespace import RDF, RDFS, OWL
-
-            for subject in validator.graph.subjects():
-                if isinstance(subject, URIRef):
-                    uri_str = str(subject)
-                    # Extract fragment from URI
-                    fragment = uri_str.split('#')[-1] if '#' in uri_str else uri_str.split('/')[-1]
-
-                    # Check if rule_name matches fragment (case-insensitive, partial)
-                    if (rule_name_lower in fragment.lower() or
-                        fragment.lower() in rule_name_lower):
-                        found = True
-                        explanation_parts.append(f"Found: {fragment}")
-                        explanation_parts.append(f"URI: {uri_str}")
-
-                        # Get rdfs:comment
-                        for comment in validator.graph.objects(subject, RDFS.comment):
-                            explanation_parts.append(f"Description: {str(comment)}")
-
-                        # Get rdfs:label
-                        for label in validator.graph.objects(subject, RDFS.label):
-                            explanation_parts.append(f"Label: {str(label)}")
-
-                        # Get rdf:type
-                        for rdf_type in validator.graph.objects(subject, RDF.type):
-                            type_name = str(rdf_type).split('#')[-1] if '#' in str(rdf_type) else str(rdf_type)
-                            if type_name not in ['Class', 'NamedIndividual']:
-                                explanation_parts.append(f"Type: {type_name}")
-                        break
+            action_name = next(
+                (name for name in action_rules
+                 if rule_name_lower in name or name in rule_name_lower),
+                None
+            )
+            if action_name is not None:
+                found = True
+                _describe_action_rule(action_name, action_rules[action_name],
+                                      explanation_parts, constraints, applies_to)
+            else:
+                # Fragment index is built once per validator, not per request
+                subject = validator._match_fragment(rule_name_lower)
+                if subject is not None:
+                    found = True
+                    _describe_subject(validator.graph, subject, explanation_parts)
 
         # Method 3: SPARQL with partial match
         if not found:
-            query = f"""
-            PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-            PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-            PREFIX owl: <http://www.w3.org/2002/07/owl#>
-
-            SELECT DISTINCT ?subject ?label ?comment ?type
-            WHERE {{
-                ?subject rdfs:label ?label .
-                FILTER(CONTAINS(LCASE(?label), LCASE("{rule_name_lower}")))
-                OPTIONAL {{ ?subject rdfs:comment ?comment }}
-                OPTIONAL {{ ?subject rdf:type ?type }}
-            }}
-            LIMIT 5
-            """
-
             try:
-                results = validator.graph.query(query)
+                results = validator.graph.query(
+                    _explain_query(),
+                    initBindings={"needle": Literal(rule_name_lower)}
+                )
                 for row in results:
                     found = True
                     if row.label:
@@ -473,7 +819,16 @@ def _explain_rule_impl(rule_name: str) -> Dict[str, Any]:
                     if row.comment:
                         explanation_parts.append(f"Description: {row.comment}")
             except Exception as e:
-                logger.debug(f"SPARQL query failed: {e}")
+                logger.debug("SPARQL query failed: %s", e)
+
+        # Method 4: closest action spelling (e.g. 'deleteuser' -> 'delete user'),
+        # only once nothing in the ontology matched, and only if it is close
+        if not found and action_rules:
+            close = difflib.get_close_matches(rule_name_lower, list(action_rules), n=1, cutoff=0.8)
+            if close:
+                found = True
+                _describe_action_rule(close[0], action_rules[close[0]],
+                                      explanation_parts, constraints, applies_to)
 
         # If still not found
         if not found:
@@ -495,7 +850,7 @@ def _explain_rule_impl(rule_name: str) -> Dict[str, Any]:
             "found": found
         }
 
-        logger.info(f"Rule explanation generated for '{rule_name}' (found: {found})")
+        logger.info("Rule explanation generated for '%s' (found: %s)", rule_name, found)
         return response
 
     except RuntimeError as e:
@@ -558,12 +913,17 @@ def _check_permissions_impl(
             "required_roles": ["Admin"]
         }
     """
+    user_role = _canonical_arg(user_role)
+    action = _canonical_arg(action)
+    entity = _canonical_arg(entity)
+    
     logger.info(
-        f"Checking permissions: role='{user_role}', action='{action}', entity='{entity}'"
+        "Checking permissions: role='%s', action='%s', entity='%s'",
+        user_role, action, entity
     )
     
     try:
-        validator = initialize_validator()
+        validator = _validator or initialize_validator()
         
         # Use validation with minimal context to check permissions
         context = {"role": user_role}
@@ -580,11 +940,10 @@ def _check_permissions_impl(
             # Try to infer from the reason
             if "requires role" in result.reason.lower():
                 # Extract role from reason (simplified)
-                reason_lower = result.reason.lower()
-                for role in ["admin", "manager", "customer", "doctor", "nurse"]:
-                    if role in reason_lower:
-                        required_roles = [role.capitalize()]
-                        break
+                known_roles = tuple(_config.get("known_roles") or DEFAULT_KNOWN_ROLES)
+                match = _role_pattern(known_roles).search(result.reason)
+                if match:
+                    required_roles = [match.group(1).capitalize()]
         
         response = {
             "has_permission": result.allowed,
@@ -596,8 +955,8 @@ def _check_permissions_impl(
         }
         
         logger.info(
-            f"Permission check: role='{user_role}' has permission={result.allowed} "
-            f"for action='{action}' on entity='{entity}'"
+            "Permission check: role='%s' has permission=%s for action='%s' on entity='%s'",
+            user_role, result.allowed, action, entity
         )
         
         return response
@@ -618,6 +977,7 @@ def _check_permissions_impl(
 
 # Export implementations for testing (after all are defined)
 validate_action = _validate_action_impl
+validate_actions_bulk = _validate_actions_bulk_impl
 get_allowed_actions = _get_allowed_actions_impl
 explain_rule = _explain_rule_impl
 check_permissions = _check_permissions_impl
@@ -629,10 +989,20 @@ def validate_action_tool(
     action: str,
     entity: str,
     entity_id: str,
-    context: Dict[str, Any]
+    context: Dict[str, Any],
+    compact: bool = False
 ) -> Dict[str, Any]:
     """MCP tool wrapper for validate_action."""
-    return _validate_action_impl(action, entity, entity_id, context)
+    return _validate_action_impl(action, entity, entity_id, context, compact)
+
+
+@mcp.tool()
+def validate_actions_bulk_tool(
+    requests: List[Dict[str, Any]],
+    compact: bool = False
+) -> Dict[str, Any]:
+    """MCP tool wrapper for validate_actions_bulk."""
+    return _validate_actions_bulk_impl(requests, compact)
 
 
 @mcp.tool()
@@ -673,20 +1043,22 @@ def main():
         # Set log level from config
         log_level = _config.get("log_level", "INFO").upper()
         logging.getLogger().setLevel(getattr(logging, log_level, logging.INFO))
-        logger.info(f"Log level set to: {log_level}")
+        logger.info("Log level set to: %s", log_level)
         
     except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
+        logger.error("Failed to load configuration: %s", e)
         logger.error("Server will not start without valid configuration.")
         raise
     
     # Pre-initialize validator if cache_validations is enabled
     if _config.get("cache_validations", False):
         try:
-            initialize_validator()
+            validator = initialize_validator()
             logger.info("Validator pre-initialized (caching enabled)")
+            if _config.get("warmup", True):
+                warm_up_validator(validator)
         except Exception as e:
-            logger.warning(f"Failed to pre-initialize validator: {e}")
+            logger.warning("Failed to pre-initialize validator: %s", e)
     
     # Run the MCP server
     logger.info("Starting OntoGuard MCP Server...")
@@ -7,19 +7,84 @@ against OWL ontologies.
 Enhanced with improved rule matching algorithm for 100% accuracy.
 """
 
+import bisect
+import difflib
+import hashlib
 import logging
+import os
+import pickle
 import re
+import sys
+import threading
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 
 from pydantic import BaseModel, Field, ConfigDict
 from rdflib import Graph, URIRef, Literal, Namespace
 from rdflib.namespace import RDF, RDFS, OWL
 
+from . import __version__
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _uri_fragment(uri: str) -> str:
+    """Return the part of a URI after the last '#', or after the last '/' if it has no '#'."""
+    _, sep, fragment = uri.rpartition('#')
+    return fragment if sep else uri.rpartition('/')[2]
+
+
+# Role aliases for matching (bidirectional)
+# When comparing roles, both are normalized to the same canonical form
+ROLE_ALIASES = {
+    'labtech': 'labtechnician',
+    'labtechnician': 'labtechnician',
+    'insurance': 'insurance',  # Keep as 'insurance' since OWL uses this
+    'insuranceagent': 'insurance',  # Map to 'insurance' for matching
+}
+
+
+@lru_cache(maxsize=1024)
+def _normalize_key(value: str) -> str:
+    """Lowercase and strip a request argument (callers repeat a few names, so cached)."""
+    return value.lower().strip()
+
+
+@lru_cache(maxsize=512)
+def _normalize_role(role: str) -> str:
+    """Lowercase, strip and alias a role name (few distinct roles, so cached)."""
+    role_lower = _normalize_key(role)
+    return ROLE_ALIASES.get(role_lower, role_lower)
+
+
+_CAMEL_SPLIT = re.compile(r'([A-Z])')
+
+# Class names whose instances are treated as action individuals
+_ACTION_CLASS_RE = re.compile(r'Action|Create|Delete|Modify|Process|Cancel')
+
+
+@lru_cache(maxsize=512)
+def _normalize_action_name(name: str) -> str:
+    """Turn a camelCase/PascalCase action name into lowercase words (cached)."""
+    if name.endswith('Action'):
+        name = name[:-6]
+    return _CAMEL_SPLIT.sub(r' \1', name).strip().lower()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """sys.intern a rule component so rules sharing a name share one string."""
+    return sys.intern(value) if value else value
+
+
+def _longest_first_alternation(words: List[str]) -> str:
+    """Regex alternation of the words, longest first so the longest prefix wins."""
+    return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
 class ValidationResult(BaseModel):
     """
     Result of an ontology validation operation.
@@ -63,14 +128,15 @@ class ParsedRule:
         applies_to: Explicit appliesTo from ontology (if any)
     """
 
-    # Role aliases for matching (bidirectional)
-    # When comparing roles, both are normalized to the same canonical form
-    ROLE_ALIASES = {
-        'labtech': 'labtechnician',
-        'labtechnician': 'labtechnician',
-        'insurance': 'insurance',  # Keep as 'insurance' since OWL uses this
-        'insuranceagent': 'insurance',  # Map to 'insurance' for matching
-    }
+    # Module-level table, also exposed here for existing callers
+    ROLE_ALIASES = ROLE_ALIASES
+
+    # Ontologies can hold thousands of rules; slots drop the per-instance dict
+    __slots__ = (
+        'uri', 'name', 'role', 'action', 'entity', 'requires_role',
+        'requires_approval', 'applies_to', 'requires_ownership',
+        '_role_norm', '_entity_without_own', '_entity_keys',
+    )
 
     def __init__(
         self,
@@ -83,22 +149,30 @@ class ParsedRule:
         requires_approval: Optional[str] = None,
         applies_to: Optional[str] = None
     ):
+        # Components repeat across rules (a few roles and verbs, shared
+        # entities), so they are interned: one copy each, identity-fast ==.
+        # Names are interned too; they are copied into every allowed-actions
+        # list and suggestion, and used as keys by the memo tables
         self.uri = uri
-        self.name = name
-        self.role = role
-        self.action = action
-        self.entity = entity
-        self.requires_role = requires_role or role  # Use parsed role if no explicit requiresRole
-        self.requires_approval = requires_approval
-        self.applies_to = applies_to or entity  # Use parsed entity if no explicit appliesTo
+        self.name = _intern(name)
+        self.role = _intern(role)
+        self.action = _intern(action)
+        self.entity = _intern(entity)
+        self.requires_role = _intern(requires_role or role)  # Use parsed role if no explicit requiresRole
+        self.requires_approval = _intern(requires_approval)
+        self.applies_to = _intern(applies_to or entity)  # Use parsed entity if no explicit appliesTo
         # Detect "own" rules that require ownership verification
         self.requires_ownership = entity and 'own' in entity.lower()
+        # Per-rule constants used by matches(), computed once
+        self._role_norm = _normalize_role(self.requires_role) if self.requires_role else None
+        self._entity_without_own = _intern(entity.replace('own', '')) if entity else None
+        # Exact spellings of the entity (as named, and without 'own')
+        self._entity_keys = frozenset((entity, self._entity_without_own)) if entity else frozenset()
 
     @classmethod
     def normalize_role(cls, role: str) -> str:
         """Normalize role name using aliases."""
-        role_lower = role.lower().strip()
-        return cls.ROLE_ALIASES.get(role_lower, role_lower)
+        return _normalize_role(role)
 
     def matches(self, action: str, entity: str, role: str) -> bool:
         """
@@ -112,9 +186,9 @@ class ParsedRule:
         Returns:
             True if all components match (or entity is 'own' for self-access rules)
         """
-        action_lower = action.lower().strip()
-        entity_lower = entity.lower().strip()
-        role_lower = self.normalize_role(role)
+        action_lower = _normalize_key(action)
+        entity_lower = _normalize_key(entity)
+        role_lower = _normalize_role(role)
 
         # Check action match
         if self.action and self.action != action_lower:
@@ -123,8 +197,7 @@ class ParsedRule:
         # Check entity match (handle 'own' prefix for self-access)
         if self.entity:
             entity_matches = (
-                self.entity == entity_lower or
-                self.entity.replace('own', '') == entity_lower or
+                entity_lower in self._entity_keys or
                 entity_lower in self.entity or
                 self.entity in entity_lower
             )
@@ -135,13 +208,9 @@ class ParsedRule:
         if role_lower == 'admin':
             return True
 
-        # Normalize rule's role for comparison
-        rule_role = self.normalize_role(self.requires_role) if self.requires_role else None
-        if rule_role is None and self.role:
-            rule_role = self.normalize_role(self.role)
-
-        if rule_role:
-            return rule_role == role_lower
+        # Compare against the rule's pre-normalized role
+        if self._role_norm:
+            return self._role_norm == role_lower
 
         return True
 
@@ -161,6 +230,13 @@ class OntologyValidator:
     combined rule names (e.g., 'DoctorReadMedicalRecord') and matches
     by all three components: role + action + entity.
 
+    validate() and the other query methods may be called from several
+    threads at once. They write only to the memo tables, one dict operation
+    at a time, so a race at worst computes an entry twice. The lazily
+    built graph and graph indices are created under a per-validator lock
+    and published only when complete. The query methods are CPU-bound and
+    hold the GIL, so extra threads do not make them faster.
+
     Attributes:
         ontology_path: Path to the OWL ontology file
         graph: RDF graph containing the loaded ontology
@@ -187,42 +263,205 @@ class OntologyValidator:
         'parent', 'admin', 'nurse', 'pupil', 'guest', 'dean', 'user'
     ]
 
+    # Maximum entries per memo table (see _memoize)
+    MEMO_SIZE = 4096
+
+    # Classes sampled by _detect_base_namespace when there is no owl:Ontology
+    NAMESPACE_SAMPLE_SIZE = 500
+
+    # Layout of validators pickled by load_cached; bump whenever the state
+    # set up by _init_state changes so older cache entries are not reused
+    CACHE_FORMAT = 4
+
+    # Below this many known entities, partial entity matches are a plain scan
+    ENTITY_SCAN_LIMIT = 32
+
+    # Splits a rule name into optional role and action prefixes plus the rest
+    # in one match. Alternatives are longest first, so e.g. 'labtechnician'
+    # is preferred over 'labtech'; the groups never need to backtrack since
+    # the entity group accepts anything.
+    _RULE_NAME_RE = re.compile(
+        f"({_longest_first_alternation(ROLE_NAMES)})?"
+        f"({_longest_first_alternation(ACTION_VERBS)})?"
+        "(.*)",
+        re.DOTALL,
+    )
+
     def __init__(self, ontology_path: str) -> None:
         """
         Initialize the OntologyValidator with an OWL ontology file.
 
         Args:
-            ontology_path: Path to the OWL ontology file (.owl, .rdf, .ttl, etc.)
+            ontology_path: Path to the OWL ontology file (.owl, .rdf, .ttl, etc.,
+                or .hdt with the optional rdflib-hdt package)
 
         Raises:
             FileNotFoundError: If the ontology file does not exist
             ValueError: If the ontology file cannot be parsed
             Exception: For other errors during ontology loading
         """
+        self._init_state(ontology_path)
+
+        logger.info(f"Initializing OntologyValidator with ontology: {ontology_path}")
+
+        if not self.ontology_path.exists():
+            error_msg = f"Ontology file not found: {ontology_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        self._load_ontology()
+
+    @classmethod
+    def from_graph(cls, graph: Graph, ontology_path: str) -> "OntologyValidator":
+        """
+        Create a validator from an already-parsed RDF graph.
+
+        Skips file parsing entirely, which lets callers reuse a graph loaded
+        from a faster source.
+
+        Args:
+            graph: Parsed RDF graph of the ontology
+            ontology_path: Path of the ontology file the graph was parsed from
+
+        Returns:
+            OntologyValidator with rules parsed from the given graph
+        """
+        validator = cls.__new__(cls)
+        validator._init_state(ontology_path)
+        validator.graph = graph
+        validator._triple_count = len(graph)
+        validator._loaded = True
+        validator._parse_action_rules()
+        return validator
+
+    @classmethod
+    def load_cached(cls, ontology_path: str, cache_dir: Path) -> "OntologyValidator":
+        """
+        Load a validator, reusing the parse of an identical file from cache_dir.
+
+        Loaded validators (parsed rule indices and the _build_indices
+        tables, without the RDF graph) are pickled under cache_dir, keyed on the SHA-256 of the ontology file
+        plus the package version and CACHE_FORMAT, so any edit to the file or
+        upgrade triggers a fresh parse. Entries that fail to load or lack
+        state this version expects are treated as misses and rebuilt. A cache hit skips both
+        the RDF parse and rule extraction; the graph itself is only parsed if
+        something reads validator.graph, which info, completion and warm-up
+        do not need to. HDT files are opened directly: they
+        are already indexed and their graphs are backed by the file itself.
+
+        Args:
+            ontology_path: Path to the ontology file
+            cache_dir: Directory holding cached validators (created on demand)
+
+        Returns:
+            Loaded OntologyValidator instance
+        """
+        path = Path(ontology_path)
+        if path.suffix.lower() == '.hdt':
+            return cls(str(path))
+
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        cache_file = Path(cache_dir) / f"{digest}.{__version__}-{cls.CACHE_FORMAT}.validator.pkl"
+
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    validator = pickle.load(f)
+                if isinstance(validator, cls) and cls._state_names() <= vars(validator).keys():
+                    # Same content may live at another path than when cached
+                    validator.ontology_path = path
+                    return validator
+                logger.info(f"Ignoring stale validator cache entry: {cache_file}")
+            except Exception:
+                pass  # Corrupt or incompatible cache entry - parse from scratch
+
+        validator = cls(str(path))
+
+        # Cache the graph indices too, so graph-free entries still serve
+        # ontology info, completion and warm-up
+        validator._build_indices()
+
+        # Caching is best-effort; write to a temp file so readers never see partial data
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(validator, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+        return validator
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _state_names(cls) -> FrozenSet[str]:
+        """Attribute names every loaded validator has (those set by _init_state)."""
+        probe = cls.__new__(cls)
+        probe._init_state("")
+        return frozenset(vars(probe))
+
+    def _init_state(self, ontology_path: str) -> None:
+        """Initialize empty graph and rule storage."""
         self.ontology_path = Path(ontology_path)
-        self.graph: Optional[Graph] = None
+        self._graph: Optional[Graph] = None
+        # rdflib format to re-parse a graph left out of a pickle, None if the
+        # graph cannot be re-parsed (HDT files, graphs handed to from_graph)
+        self._graph_format: Optional[str] = None
+        self._triple_count = 0
         self._loaded = False
+        # Guards the lazy graph re-parse and _build_indices; not pickled
+        self._lazy_lock = threading.RLock()
 
         # Enhanced rule storage
         self._parsed_rules: List[ParsedRule] = []  # All parsed rules
         self._rules_by_action: Dict[str, List[ParsedRule]] = {}  # action -> rules
         self._rules_by_entity: Dict[str, List[ParsedRule]] = {}  # entity -> rules
         self._rules_by_role: Dict[str, List[ParsedRule]] = {}  # role -> rules
+        # action -> parallel (rules, entities, exact entity spellings, normalized
+        # roles) tuples scanned by _scan_matching_rules
+        self._rule_columns: Dict[str, Tuple[Tuple[Any, ...], ...]] = {}
+        # Known entity names: ontology classes plus rule entities (see _build_rule_index)
+        self._entity_names: FrozenSet[str] = frozenset()
+        # Trigram -> known entities containing it, and the distinct lengths of
+        # known entities; used by _partial_entity_match on large catalogs
+        self._entity_trigrams: Dict[str, Set[str]] = {}
+        self._entity_lengths: Tuple[int, ...] = ()
+        # (rule name, lowercased appliesTo) pairs and the sorted known actions,
+        # used by _find_actions_for_entity_simple and _suggest_similar_actions
+        self._action_targets: Tuple[Tuple[str, str], ...] = ()
+        self._default_actions: Tuple[str, ...] = ()
+        # Distinct names used by denial explanations, in rule order
+        self._entities_by_action_role: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._actions_by_role: Dict[str, Tuple[str, ...]] = {}
 
         # Legacy storage (for backwards compatibility)
         self._action_rules: Dict[str, Dict[str, Any]] = {}
         self._known_entities: Set[str] = set()
         self._known_actions: Set[str] = set()
         self._base_namespace: Optional[str] = None
-
-        logger.info(f"Initializing OntologyValidator with ontology: {ontology_path}")
-
-        if not self.ontology_path.exists():
-            error_msg = f"Ontology file not found: {ontology_path}"
-            logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
-
-        self._load_ontology()
+        self._predicates_by_name: Optional[Dict[str, URIRef]] = None  # see _find_property_uri
+
+        # Memoized lookups that depend only on the parsed rules; bounded by
+        # MEMO_SIZE and cleared whenever rules are (re)parsed
+        self._match_cache: Dict[Tuple[str, str, str], Tuple[ParsedRule, ...]] = {}
+        self._entity_check_cache: Dict[str, bool] = {}
+        self._suggestion_cache: Dict[str, Tuple[str, ...]] = {}
+        self._allowed_actions_cache: Dict[str, Tuple[str, ...]] = {}
+        self._decision_cache: Dict[Tuple[str, str, str, bool], Tuple[Any, ...]] = {}
+        # Depends only on the class vocabularies, so it survives re-parsing
+        self._rule_name_cache: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]] = {}
+
+        # Lazily built graph indices (see _build_indices)
+        self._by_type: Optional[Dict[Any, List[Any]]] = None
+        self._labels: Optional[Dict[Any, str]] = None
+        self._extra_labels: Optional[Dict[Any, List[str]]] = None
+        self._fragments: Optional[Dict[str, List[URIRef]]] = None
+        self._fragment_blob: Optional[str] = None  # see _match_fragment
+        self._fragment_keys: List[str] = []
+        self._fragment_order: Dict[str, int] = {}
+        self._fragment_offsets: List[int] = []
+        self._typed_subject_count = 0
 
     def _load_ontology(self) -> None:
         """
@@ -234,27 +473,33 @@ class OntologyValidator:
         """
         try:
             logger.debug(f"Loading ontology from: {self.ontology_path}")
-            self.graph = Graph()
 
             # Determine file format from extension
             file_ext = self.ontology_path.suffix.lower()
-            format_map = {
-                '.owl': 'xml',
-                '.rdf': 'xml',
-                '.ttl': 'turtle',
-                '.n3': 'n3',
-                '.nt': 'nt',
-                '.jsonld': 'json-ld'
-            }
 
-            file_format = format_map.get(file_ext, 'xml')
-            logger.debug(f"Detected file format: {file_format}")
+            if file_ext == '.hdt':
+                # HDT files are already compressed and indexed; query them in place
+                self.graph = self._open_hdt_graph()
+            else:
+                self.graph = Graph()
+                format_map = {
+                    '.owl': 'xml',
+                    '.rdf': 'xml',
+                    '.ttl': 'turtle',
+                    '.n3': 'n3',
+                    '.nt': 'nt',
+                    '.jsonld': 'json-ld'
+                }
+
+                file_format = format_map.get(file_ext, 'xml')
+                logger.debug(f"Detected file format: {file_format}")
 
-            # Load the ontology
-            self.graph.parse(str(self.ontology_path), format=file_format)
+                # Load the ontology
+                self.graph.parse(str(self.ontology_path), format=file_format)
+                self._graph_format = file_format
 
             # Log basic statistics
-            num_triples = len(self.graph)
+            num_triples = self._triple_count = len(self.graph)
             logger.info(f"Successfully loaded ontology: {num_triples} triples")
 
             if num_triples == 0:
@@ -268,6 +513,77 @@ class OntologyValidator:
             logger.error(error_msg, exc_info=True)
             raise ValueError(error_msg) from e
 
+    @property
+    def graph(self) -> Optional[Graph]:
+        """
+        RDF graph of the loaded ontology.
+
+        Validators restored by load_cached arrive without their graph, since
+        rule checks only use the parsed indices; it is re-parsed from
+        ontology_path the first time it is read.
+        """
+        if self._graph is None and self._graph_format is not None:
+            with self._lazy_lock:
+                if self._graph is None and self._graph_format is not None:
+                    logger.debug(f"Re-parsing ontology graph from: {self.ontology_path}")
+                    graph = Graph()
+                    graph.parse(str(self.ontology_path), format=self._graph_format)
+                    self._graph = graph
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Optional[Graph]) -> None:
+        # An explicitly assigned graph is never swapped for a re-parse
+        self._graph = graph
+        self._graph_format = None
+
+    @property
+    def triple_count(self) -> int:
+        """Number of triples in the ontology, without re-parsing the graph."""
+        return len(self._graph) if self._graph is not None else self._triple_count
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if state['_graph_format'] is not None:
+            # Re-parseable from ontology_path; keeps pickles small and fast
+            state['_graph'] = None
+        del state['_lazy_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lazy_lock = threading.RLock()
+
+    def _open_hdt_graph(self) -> Graph:
+        """
+        Open an HDT (Header-Dictionary-Triples) file as a read-only graph.
+
+        Raises:
+            ImportError: If the optional rdflib-hdt package is not installed
+        """
+        try:
+            from rdflib_hdt import HDTStore
+        except ImportError:
+            raise ImportError(
+                "rdflib-hdt is required to load .hdt ontologies. Install with: pip install rdflib-hdt"
+            )
+
+        return Graph(store=HDTStore(str(self.ontology_path)))
+
+    def _clear_memos(self) -> None:
+        """Forget memoized rule lookups (call whenever the rules change)."""
+        self._match_cache.clear()
+        self._entity_check_cache.clear()
+        self._suggestion_cache.clear()
+        self._allowed_actions_cache.clear()
+        self._decision_cache.clear()
+
+    def _memoize(self, cache: Dict[Any, Any], key: Any, value: Any) -> None:
+        """Store a memoized value, starting over once MEMO_SIZE is reached."""
+        if len(cache) >= self.MEMO_SIZE:
+            cache.clear()
+        cache[key] = value
+
     def _parse_action_rules(self) -> None:
         """
         Parse action rules and entity types from the loaded ontology.
@@ -278,16 +594,22 @@ class OntologyValidator:
             return
 
         logger.debug("Parsing action rules from ontology...")
+        self._clear_memos()
+        self._predicates_by_name = None
 
         # Detect base namespace from ontology
         self._base_namespace = self._detect_base_namespace()
         logger.debug(f"Detected base namespace: {self._base_namespace}")
 
+        # One walk over the rdf:type triples serves both passes below
+        classes, action_typed = self._scan_rdf_types()
+
         # Parse entity types (OWL classes)
-        self._parse_entity_types()
+        self._parse_entity_types(classes)
 
         # Parse action individuals and their rules (enhanced)
-        self._parse_action_individuals_enhanced()
+        self._parse_action_individuals_enhanced(action_typed)
+        self._build_rule_index()
 
         logger.info(
             f"Parsed {len(self._parsed_rules)} action rules, "
@@ -295,53 +617,240 @@ class OntologyValidator:
             f"{len(self._known_actions)} action names"
         )
 
+    def _build_rule_index(self) -> None:
+        """
+        Build the per-action rule columns scanned by _scan_matching_rules.
+
+        Also derives the merged entity-name set used by _check_entity_type
+        and the distinct-name tables used by denial explanations. Everything
+        here is a single pass over the rules; (action, entity, role) results
+        are memoized lazily in _match_cache as requests arrive.
+        """
+        self._rule_columns = {
+            action: (
+                tuple(rules),
+                tuple(rule.entity for rule in rules),
+                tuple(rule._entity_keys for rule in rules),
+                tuple(rule._role_norm for rule in rules),
+            )
+            for action, rules in self._rules_by_action.items()
+        }
+
+        self._entity_names = frozenset(self._known_entities.union(self._rules_by_entity))
+
+        entity_trigrams: Dict[str, Set[str]] = {}
+        for known_entity in self._known_entities:
+            for i in range(len(known_entity) - 2):
+                entity_trigrams.setdefault(known_entity[i:i + 3], set()).add(known_entity)
+        self._entity_trigrams = entity_trigrams
+        self._entity_lengths = tuple(sorted({len(known_entity) for known_entity in self._known_entities}))
+
+        self._action_targets = tuple(
+            (action_name, (rule.get("appliesTo") or "").lower())
+            for action_name, rule in self._action_rules.items()
+        )
+        self._default_actions = tuple(sorted(self._known_actions))
+
+        entities_by_action_role: Dict[Tuple[str, str], Dict[str, None]] = {}
+        for action, rules in self._rules_by_action.items():
+            for rule in rules:
+                if rule.role and rule.entity:
+                    entities_by_action_role.setdefault((action, rule.role), {})[rule.entity] = None
+        self._entities_by_action_role = {
+            key: tuple(entities) for key, entities in entities_by_action_role.items()
+        }
+        self._actions_by_role = {
+            role: tuple(dict.fromkeys(rule.action for rule in rules if rule.action))
+            for role, rules in self._rules_by_role.items()
+        }
+
+    def _build_indices(self) -> None:
+        """
+        Index subjects by rdf:type and resources by rdfs:label in one graph pass.
+
+        Populates self._by_type (type -> subjects), self._labels
+        (resource -> first rdfs:label), self._extra_labels (resource -> any
+        further labels, for the few resources that have them),
+        self._fragments (lowercased URI fragment -> subject URIs) and
+        self._typed_subject_count (distinct subjects with any rdf:type). Loaded graphs are treated as read-only,
+        so the indices are built on first use and then reused; _by_type is
+        set last, so other threads never see a partly built set.
+        """
+        if self._by_type is not None:
+            return
+        with self._lazy_lock:
+            if self._by_type is None and self.graph is not None:
+                self._build_indices_locked()
+
+    def _build_indices_locked(self) -> None:
+        """Body of _build_indices; the caller holds _lazy_lock."""
+        by_type: Dict[Any, List[Any]] = {}
+        labels: Dict[Any, str] = {}
+        extra_labels: Dict[Any, List[str]] = {}
+        fragments: Dict[str, List[URIRef]] = {}
+        seen_subjects: Set[Any] = set()
+        typed_subjects: Set[Any] = set()
+
+        for subj, pred, obj in self.graph:
+            if subj not in seen_subjects:
+                seen_subjects.add(subj)
+                if isinstance(subj, URIRef):
+                    fragment = _uri_fragment(subj)
+                    if fragment:
+                        fragments.setdefault(fragment.lower(), []).append(subj)
+            if pred == RDF.type:
+                by_type.setdefault(obj, []).append(subj)
+                typed_subjects.add(subj)
+            elif pred == RDFS.label:
+                if subj not in labels:
+                    labels[subj] = str(obj)
+                else:
+                    extra_labels.setdefault(subj, []).append(str(obj))
+
+        self._labels = labels
+        self._extra_labels = extra_labels
+        self._fragments = fragments
+        self._typed_subject_count = len(typed_subjects)
+        self._by_type = by_type
+
+    def _match_fragment(self, needle: str, partial: bool = True) -> Optional[URIRef]:
+        """
+        Find a subject by lowercased URI fragment.
+
+        Returns a subject whose fragment equals needle if there is one,
+        otherwise (unless partial is False) the first subject (in index
+        order) whose fragment contains needle or is contained in it, or None.
+
+        Partial matching avoids a Python-level loop over every fragment:
+        "fragment contains needle" is one str.find over all fragments joined
+        by newlines, and "needle contains fragment" looks up each substring
+        of needle when that is cheaper than scanning the fragments.
+        """
+        self._build_indices()
+        fragments = self._fragments
+        if not fragments:
+            return None
+
+        exact = fragments.get(needle)
+        if exact:
+            return exact[0]
+        if not partial:
+            return None
+
+        if self._fragment_blob is None:
+            with self._lazy_lock:
+                if self._fragment_blob is None:
+                    keys = list(fragments)
+                    offsets = []
+                    position = 0
+                    for key in keys:
+                        offsets.append(position)
+                        position += len(key) + 1
+                    self._fragment_keys = keys
+                    self._fragment_order = {key: i for i, key in enumerate(keys)}
+                    self._fragment_offsets = offsets
+                    # Set last: a non-None blob means the tables above are ready
+                    self._fragment_blob = '\n'.join(keys)
+
+        keys = self._fragment_keys
+        best = len(keys)
+
+        # Fragments containing needle (URIs never contain newlines)
+        if '\n' not in needle:
+            pos = self._fragment_blob.find(needle)
+            if pos != -1:
+                best = bisect.bisect_right(self._fragment_offsets, pos) - 1
+
+        # Fragments contained in needle, whichever way is cheaper
+        n = len(needle)
+        if n * (n + 1) // 2 < best:
+            order = self._fragment_order
+            for start in range(n):
+                for end in range(start + 1, n + 1):
+                    i = order.get(needle[start:end])
+                    if i is not None and i < best:
+                        best = i
+        else:
+            for i in range(best):
+                if keys[i] in needle:
+                    best = i
+                    break
+
+        return fragments[keys[best]][0] if best < len(keys) else None
+
     def _detect_base_namespace(self) -> Optional[str]:
         """Detect the base namespace of the ontology."""
         if self.graph is None:
             return None
 
-        # Look for owl:Ontology declaration
-        for ontology in self.graph.subjects(RDF.type, OWL.Ontology):
+        # Look for owl:Ontology declaration (the first one is enough)
+        ontology = next(self.graph.subjects(RDF.type, OWL.Ontology), None)
+        if ontology is not None:
             uri_str = str(ontology)
             # Add # if not present
             if not uri_str.endswith('#') and not uri_str.endswith('/'):
                 return uri_str + '#'
             return uri_str
 
-        # Fallback: find common namespace from classes
-        namespaces = {}
-        for cls in self.graph.subjects(RDF.type, OWL.Class):
-            uri_str = str(cls)
-            if '#' in uri_str:
-                ns = uri_str.rsplit('#', 1)[0] + '#'
-                namespaces[ns] = namespaces.get(ns, 0) + 1
+        # Fallback: find the most common namespace among a sample of classes,
+        # which settles the majority without walking every class
+        namespaces = Counter(
+            uri_str.rpartition('#')[0] + '#'
+            for uri_str in map(str, islice(self.graph.subjects(RDF.type, OWL.Class), self.NAMESPACE_SAMPLE_SIZE))
+            if '#' in uri_str
+        )
 
         if namespaces:
-            return max(namespaces, key=namespaces.get)
+            return namespaces.most_common(1)[0][0]
 
         return None
 
-    def _parse_entity_types(self) -> None:
-        """Parse entity types (OWL classes) from ontology."""
-        if self.graph is None:
-            return
+    def _scan_rdf_types(self) -> Tuple[List[Any], Set[Any]]:
+        """
+        Collect OWL classes and instances of action-like classes in one pass.
+
+        Walks the rdf:type triples once. Each distinct type's local name is
+        tested against _ACTION_CLASS_RE the first time it is seen only.
+
+        Returns:
+            (subjects typed owl:Class, subjects typed with an action class)
+        """
+        classes: List[Any] = []
+        action_typed: Set[Any] = set()
+        is_action_type: Dict[Any, bool] = {}
 
-        for cls in self.graph.subjects(RDF.type, OWL.Class):
+        for subj, _, obj in self.graph.triples((None, RDF.type, None)):
+            if obj == OWL.Class:
+                classes.append(subj)
+            action_type = is_action_type.get(obj)
+            if action_type is None:
+                action_type = is_action_type[obj] = (
+                    isinstance(obj, URIRef)
+                    and _ACTION_CLASS_RE.search(_uri_fragment(str(obj))) is not None
+                )
+            if action_type:
+                action_typed.add(subj)
+
+        return classes, action_typed
+
+    def _parse_entity_types(self, classes: List[Any]) -> None:
+        """Parse entity types from the ontology's OWL classes."""
+        for cls in classes:
             cls_str = str(cls)
 
             # Get label
             label = self._get_label(cls)
             if label:
-                self._known_entities.add(label.lower())
+                self._known_entities.add(sys.intern(label.lower()))
 
             # Also add fragment from URI
             if '#' in cls_str:
                 fragment = cls_str.split('#')[-1]
-                self._known_entities.add(fragment.lower())
+                self._known_entities.add(sys.intern(fragment.lower()))
 
         logger.debug(f"Found entity types: {self._known_entities}")
 
-    def _parse_action_individuals_enhanced(self) -> None:
+    def _parse_action_individuals_enhanced(self, action_typed: Set[Any]) -> None:
         """
         Parse action individuals with enhanced component extraction.
 
@@ -349,6 +858,9 @@ class OntologyValidator:
         1. Finds all action-related individuals in the ontology
         2. Parses their names to extract role, action, and entity components
         3. Stores rules in indexed structures for fast lookup
+
+        Args:
+            action_typed: Instances of action-like classes (see _scan_rdf_types)
         """
         if self.graph is None:
             return
@@ -361,20 +873,14 @@ class OntologyValidator:
         logger.debug(f"Found property URIs: requiresRole={requires_role_prop}, "
                      f"requiresApproval={requires_approval_prop}, appliesTo={applies_to_prop}")
 
-        # Find all subjects that have any of these properties (action individuals)
-        action_subjects = set()
-        props_to_check = [p for p in [requires_role_prop, applies_to_prop] if p is not None]
-        for prop in props_to_check:
-            for subj in self.graph.subjects(prop, None):
-                action_subjects.add(subj)
-
-        # Also find individuals that are instances of Action subclasses
-        for subj, _, obj in self.graph.triples((None, RDF.type, None)):
-            if isinstance(obj, URIRef):
-                obj_str = str(obj)
-                class_name = obj_str.split('#')[-1] if '#' in obj_str else obj_str.split('/')[-1]
-                if any(keyword in class_name for keyword in ['Action', 'Create', 'Delete', 'Modify', 'Process', 'Cancel']):
-                    action_subjects.add(subj)
+        # Read each property once for all subjects, then join per subject
+        # below. Action individuals are the instances of Action subclasses
+        # plus every subject of requiresRole or appliesTo, collected by the
+        # same passes
+        action_subjects = set(action_typed)
+        role_of = self._property_values(requires_role_prop, action_subjects)
+        approval_of = self._property_values(requires_approval_prop)
+        applies_to_of = self._property_values(applies_to_prop, action_subjects)
 
         logger.debug(f"Found {len(action_subjects)} action subjects")
 
@@ -392,28 +898,10 @@ class OntologyValidator:
             else:
                 continue
 
-            # Parse explicit properties
-            explicit_role = None
-            explicit_approval = None
-            explicit_applies_to = None
-
-            if requires_role_prop:
-                for _, _, role_obj in self.graph.triples((action_subj, requires_role_prop, None)):
-                    role_name = self._extract_name_from_uri(str(role_obj))
-                    if role_name:
-                        explicit_role = role_name.lower()
-
-            if requires_approval_prop:
-                for _, _, approval_obj in self.graph.triples((action_subj, requires_approval_prop, None)):
-                    approval_name = self._extract_name_from_uri(str(approval_obj))
-                    if approval_name:
-                        explicit_approval = approval_name.lower()
-
-            if applies_to_prop:
-                for _, _, applies_obj in self.graph.triples((action_subj, applies_to_prop, None)):
-                    applies_name = self._extract_name_from_uri(str(applies_obj))
-                    if applies_name:
-                        explicit_applies_to = applies_name.lower()
+            # Explicit properties, looked up from the per-property maps
+            explicit_role = role_of.get(action_subj)
+            explicit_approval = approval_of.get(action_subj)
+            explicit_applies_to = applies_to_of.get(action_subj)
 
             # Extract components from rule name (e.g., 'DoctorReadMedicalRecord')
             parsed_role, parsed_action, parsed_entity = self._parse_rule_name(full_name)
@@ -432,6 +920,9 @@ class OntologyValidator:
 
             self._parsed_rules.append(rule)
 
+            # Key the indices on the rule's interned components
+            parsed_role, parsed_action, parsed_entity = rule.role, rule.action, rule.entity
+
             # Index rule by action
             if parsed_action:
                 if parsed_action not in self._rules_by_action:
@@ -441,7 +932,7 @@ class OntologyValidator:
 
             # Index rule by entity
             if parsed_entity:
-                entity_key = parsed_entity.replace('own', '')  # Normalize 'ownmedicalrecord' -> 'medicalrecord'
+                entity_key = rule._entity_without_own  # Normalize 'ownmedicalrecord' -> 'medicalrecord'
                 if entity_key not in self._rules_by_entity:
                     self._rules_by_entity[entity_key] = []
                 self._rules_by_entity[entity_key].append(rule)
@@ -478,6 +969,10 @@ class OntologyValidator:
         Returns:
             Tuple of (role, action, entity) or (None, None, None) if parsing fails
         """
+        cached = self._rule_name_cache.get(name)
+        if cached is not None:
+            return cached
+
         name_lower = name.lower().strip()
 
         # Remove common suffixes
@@ -485,29 +980,33 @@ class OntologyValidator:
             if name_lower.endswith(suffix):
                 name_lower = name_lower[:-len(suffix)]
 
-        parsed_role = None
-        parsed_action = None
-        parsed_entity = None
-
-        # Try to extract role (at the beginning)
-        for role in sorted(self.ROLE_NAMES, key=len, reverse=True):
-            if name_lower.startswith(role):
-                parsed_role = role
-                name_lower = name_lower[len(role):]
-                break
+        # Role, then action, at the beginning; the remaining part is the
+        # entity (with possible 'own' prefix)
+        parsed_role, parsed_action, parsed_entity = self._RULE_NAME_RE.match(name_lower).groups()
 
-        # Try to extract action (after role)
-        for action in sorted(self.ACTION_VERBS, key=len, reverse=True):
-            if name_lower.startswith(action):
-                parsed_action = action
-                name_lower = name_lower[len(action):]
-                break
+        parsed = (parsed_role, parsed_action, parsed_entity or None)
+        self._memoize(self._rule_name_cache, name, parsed)
+        return parsed
 
-        # Remaining part is the entity (with possible 'own' prefix)
-        if name_lower:
-            parsed_entity = name_lower
+    def _property_values(self, prop: Optional[URIRef], subjects: Optional[Set[Any]] = None) -> Dict[Any, str]:
+        """
+        Map each subject of a property to the lowercased name of its value.
 
-        return parsed_role, parsed_action, parsed_entity
+        One triples() pass per property; where a subject has several values,
+        the last one with a usable name wins. If subjects is given, every
+        subject of the property is added to it, usable value or not.
+        """
+        values: Dict[Any, str] = {}
+        if prop is None or self.graph is None:
+            return values
+
+        for subj, _, obj in self.graph.triples((None, prop, None)):
+            if subjects is not None:
+                subjects.add(subj)
+            name = self._extract_name_from_uri(str(obj))
+            if name:
+                values[subj] = name.lower()
+        return values
 
     def _find_property_uri(self, property_name: str) -> Optional[URIRef]:
         """
@@ -516,25 +1015,29 @@ class OntologyValidator:
         if self.graph is None:
             return None
 
-        property_lower = property_name.lower()
+        # Usual case: the property lives in the ontology's own namespace,
+        # which a single index lookup confirms
+        if self._base_namespace:
+            candidate = URIRef(self._base_namespace + property_name)
+            if (None, candidate, None) in self.graph:
+                return candidate
 
-        for _, predicate, _ in self.graph:
-            if isinstance(predicate, URIRef):
-                pred_str = str(predicate)
-                local_name = pred_str.split('#')[-1] if '#' in pred_str else pred_str.split('/')[-1]
-                if local_name.lower() == property_lower:
-                    return predicate
+        # Otherwise match local names against the distinct predicates,
+        # collected once per parse instead of walking every triple per call
+        if self._predicates_by_name is None:
+            by_name: Dict[str, URIRef] = {}
+            for predicate in self.graph.predicates(unique=True):
+                if isinstance(predicate, URIRef):
+                    by_name.setdefault(_uri_fragment(str(predicate)).lower(), predicate)
+            self._predicates_by_name = by_name
 
-        return None
+        return self._predicates_by_name.get(property_name.lower())
 
     def _normalize_action_name(self, name: str) -> str:
         """
         Normalize action name from camelCase/PascalCase to lowercase.
         """
-        if name.endswith('Action'):
-            name = name[:-6]
-        result = re.sub(r'([A-Z])', r' \1', name).strip().lower()
-        return result
+        return _normalize_action_name(name)
 
     def _extract_name_from_uri(self, uri: str) -> Optional[str]:
         """Extract the name part from a URI."""
@@ -565,15 +1068,74 @@ class OntologyValidator:
         Returns:
             ValidationResult containing the validation outcome and explanation
         """
-        if not self._loaded or self.graph is None:
+        if not self._loaded:
+            raise RuntimeError("Ontology not loaded. Cannot perform validation.")
+
+        logger.info("Validating action '%s' for entity '%s' (ID: %s)", action, entity, entity_id)
+        logger.debug("Context: %s", context)
+
+        user_role = _normalize_key(context.get("role", ""))
+        owner_id_given = bool(context.get("patient_id") or context.get("user_id") or context.get("owner_id"))
+        return self._validate_one(action, entity, entity_id, context, user_role, owner_id_given)
+
+    def validate_many(
+        self,
+        requests: List[Tuple[str, str, str]],
+        context: Dict[str, Any]
+    ) -> List[ValidationResult]:
+        """
+        Validate many (action, entity, entity_id) requests made in one context.
+
+        Equivalent to calling validate() for each request, but the context
+        (role, ownership ids) is read once for the whole batch and repeated
+        (action, entity) pairs reuse one memoized decision.
+
+        Args:
+            requests: (action, entity, entity_id) tuples, e.g. the rows of a list view
+            context: Context shared by all requests (user roles, owner ids, etc.)
+
+        Returns:
+            One ValidationResult per request, in request order
+        """
+        if not self._loaded:
             raise RuntimeError("Ontology not loaded. Cannot perform validation.")
 
-        logger.info(f"Validating action '{action}' for entity '{entity}' (ID: {entity_id})")
-        logger.debug(f"Context: {context}")
+        logger.info("Validating %d actions in one context", len(requests))
+        logger.debug("Context: %s", context)
 
-        action_lower = action.lower().strip()
-        entity_lower = entity.lower().strip()
-        user_role = context.get("role", "").lower().strip()
+        user_role = _normalize_key(context.get("role", ""))
+        owner_id_given = bool(context.get("patient_id") or context.get("user_id") or context.get("owner_id"))
+        return [
+            self._validate_one(action, entity, entity_id, context, user_role, owner_id_given)
+            for action, entity, entity_id in requests
+        ]
+
+    def _validate_one(
+        self,
+        action: str,
+        entity: str,
+        entity_id: str,
+        context: Dict[str, Any],
+        user_role: str,
+        owner_id_given: bool
+    ) -> ValidationResult:
+        """Build the ValidationResult for one request from its memoized decision."""
+        # The only per-request inputs besides the names: whether ownership
+        # could be verified (checked only for rules that require it)
+        owner_verified = owner_id_given and bool(entity_id and entity_id != "unknown")
+
+        key = (action, entity, user_role, owner_verified)
+        decision = self._decision_cache.get(key)
+        if decision is None:
+            # Normalize once; the helpers below all take lowercase arguments
+            decision = self._decide(
+                action, entity, _normalize_key(action), _normalize_key(entity), user_role, owner_verified
+            )
+            self._memoize(self._decision_cache, key, decision)
+        allowed, reason, suggested, extra_metadata, log_level, log_message = decision
+
+        if log_message:
+            logger.log(log_level, log_message)
 
         metadata = {
             "action": action,
@@ -581,72 +1143,72 @@ class OntologyValidator:
             "entity_id": entity_id,
             "context": context
         }
+        # Copy list values so results never share mutable state with the memo
+        for meta_key, value in extra_metadata.items():
+            metadata[meta_key] = list(value) if isinstance(value, list) else value
 
+        return ValidationResult(
+            allowed=allowed,
+            reason=reason,
+            suggested_actions=list(suggested),
+            metadata=metadata
+        )
+
+    def _decide(
+        self,
+        action: str,
+        entity: str,
+        action_lower: str,
+        entity_lower: str,
+        user_role: str,
+        owner_verified: bool
+    ) -> Tuple[bool, str, Tuple[str, ...], Dict[str, Any], int, Optional[str]]:
+        """
+        Make the validate() decision for normalized inputs.
+
+        Returns (allowed, reason, suggested actions, extra metadata, log level,
+        log message). The result depends only on the arguments, so validate()
+        memoizes it; action and entity keep the caller's spelling for messages.
+        """
         # Check if action exists in ontology
-        action_exists = self._check_action_exists(action)
+        action_exists = self._check_action_exists(action_lower)
         if not action_exists:
             reason = f"Action '{action}' is not defined in the ontology"
-            logger.warning(reason)
-            suggested = self._suggest_similar_actions(action)
-            return ValidationResult(
-                allowed=False,
-                reason=reason,
-                suggested_actions=suggested,
-                metadata=metadata
-            )
+            suggested = self._suggest_similar_actions(action_lower)
+            return False, reason, tuple(suggested), {}, logging.WARNING, reason
 
         # Check if entity type is valid
-        entity_valid = self._check_entity_type(entity)
+        entity_valid = self._check_entity_type(entity_lower)
         if not entity_valid:
             reason = f"Entity type '{entity}' is not defined in the ontology"
-            logger.warning(reason)
-            return ValidationResult(
-                allowed=False,
-                reason=reason,
-                suggested_actions=[],
-                metadata=metadata
-            )
+            return False, reason, (), {}, logging.WARNING, reason
 
         # ENHANCED: Find matching rules by action + entity + role combination
-        matching_rules = self._find_matching_rules(action_lower, entity_lower, user_role)
+        matching_rules = self._matching_rules(action_lower, entity_lower, user_role)
 
         if matching_rules:
             # At least one rule matches - check for ownership requirement
             best_rule = matching_rules[0]
 
             # Check if rule requires ownership verification (e.g., "PatientReadOwnMedicalRecord")
-            if best_rule.requires_ownership:
-                # Ownership rules require entity_id and matching owner context
-                entity_id_provided = entity_id and entity_id != "unknown"
-                owner_id_provided = context.get("patient_id") or context.get("user_id") or context.get("owner_id")
-
-                # If ownership cannot be verified, deny access
-                # Admin is exempt from ownership checks
-                if user_role != 'admin' and not (entity_id_provided and owner_id_provided):
-                    reason = f"Action '{action}' on '{entity}' requires ownership verification. " \
-                             f"Provide entity_id and patient_id/owner_id to verify ownership."
-                    logger.info(f"Denied: {reason}")
-                    metadata["validation_passed"] = False
-                    metadata["constraint_type"] = "ownership_required"
-                    metadata["matched_rule"] = best_rule.name
-                    return ValidationResult(
-                        allowed=False,
-                        reason=reason,
-                        suggested_actions=[f"Provide entity_id and patient_id to verify ownership of {entity}"],
-                        metadata=metadata
-                    )
+            # Ownership rules require entity_id and matching owner context;
+            # if ownership cannot be verified, deny access
+            # Admin is exempt from ownership checks
+            if best_rule.requires_ownership and user_role != 'admin' and not owner_verified:
+                reason = f"Action '{action}' on '{entity}' requires ownership verification. " \
+                         f"Provide entity_id and patient_id/owner_id to verify ownership."
+                extra = {
+                    "validation_passed": False,
+                    "constraint_type": "ownership_required",
+                    "matched_rule": best_rule.name,
+                }
+                suggested = (f"Provide entity_id and patient_id to verify ownership of {entity}",)
+                return False, reason, suggested, extra, logging.INFO, f"Denied: {reason}"
 
             # All checks passed - action is allowed
             reason = f"Action '{action}' is allowed for entity type '{entity}'"
-            logger.info(reason)
-            metadata["validation_passed"] = True
-            metadata["matched_rule"] = best_rule.name
-            return ValidationResult(
-                allowed=True,
-                reason=reason,
-                suggested_actions=[],
-                metadata=metadata
-            )
+            extra = {"validation_passed": True, "matched_rule": best_rule.name}
+            return True, reason, (), extra, logging.INFO, reason
 
         # DESIGN DECISION: Closed World Assumption (CWA)
         #
@@ -659,13 +1221,14 @@ class OntologyValidator:
         # serialization format for access-control rules, not as a formal
         # ontology for reasoning under OWA.
         denial_result = self._explain_denial_enhanced(action_lower, entity_lower, user_role)
-        metadata.update(denial_result.get("metadata", {}))
 
-        return ValidationResult(
-            allowed=False,
-            reason=denial_result["reason"],
-            suggested_actions=denial_result.get("suggestions", []),
-            metadata=metadata
+        return (
+            False,
+            denial_result["reason"],
+            tuple(denial_result.get("suggestions", [])),
+            denial_result.get("metadata", {}),
+            logging.DEBUG,
+            None,
         )
 
     def _find_matching_rules(
@@ -678,9 +1241,10 @@ class OntologyValidator:
         Find all rules that match the given action, entity, and role combination.
 
         This is the core of the enhanced matching algorithm:
-        1. Get rules indexed by action
-        2. Filter by entity match
-        3. Filter by role match (or Admin override)
+        1. Answer from the (action, entity, role) memo if possible
+        2. Otherwise get rules indexed by action
+        3. Filter by entity match
+        4. Filter by role match (or Admin override)
 
         Args:
             action: Action to match (lowercase)
@@ -690,22 +1254,56 @@ class OntologyValidator:
         Returns:
             List of matching ParsedRule objects
         """
-        matching = []
+        return list(self._matching_rules(action, entity, role))
 
-        # Get rules for this action
-        action_rules = self._rules_by_action.get(action, [])
+    def _matching_rules(self, action: str, entity: str, role: str) -> Tuple[ParsedRule, ...]:
+        """Shared, read-only form of _find_matching_rules (no list copy)."""
+        key = (action, entity, role)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            return cached
 
-        for rule in action_rules:
-            if rule.matches(action, entity, role):
-                matching.append(rule)
+        matching = tuple(self._scan_matching_rules(action, entity, role))
+        self._memoize(self._match_cache, key, matching)
+        return matching
 
-        # Sort by specificity (more specific rules first)
-        matching.sort(key=lambda r: (
-            r.entity == entity,  # Exact entity match
-            r.role == role,       # Exact role match
-        ), reverse=True)
+    def _scan_matching_rules(self, action: str, entity: str, role: str) -> List[ParsedRule]:
+        """
+        Filter the action's rules as ParsedRule.matches would, most specific first.
 
-        return matching
+        Works on the per-action columns from _build_rule_index, so the
+        action check and input normalization happen once rather than per rule.
+        """
+        # Specificity groups, most specific first: (exact entity, exact role),
+        # (exact entity, other role), (other entity, exact role), the rest
+        groups: Tuple[List[ParsedRule], ...] = ([], [], [], [])
+
+        columns = self._rule_columns.get(action)
+        if columns is None:
+            return []
+        rules, entities, entity_keys, roles = columns
+
+        entity_lower = _normalize_key(entity)
+        role_lower = _normalize_role(role)
+        is_admin = role_lower == 'admin'
+
+        for i, rule_entity in enumerate(entities):
+            # Entity match (handles the 'own' prefix of self-access rules)
+            if rule_entity and not (
+                entity_lower in entity_keys[i] or
+                entity_lower in rule_entity or
+                rule_entity in entity_lower
+            ):
+                continue
+
+            # Role match (Admin has all permissions; role-less rules match anyone)
+            rule_role = roles[i]
+            if is_admin or not rule_role or rule_role == role_lower:
+                rule = rules[i]
+                groups[(rule_entity != entity) * 2 + (rule.role != role)].append(rule)
+
+        # Same order as a stable sort on (exact entity, exact role), without the sort
+        return groups[0] + groups[1] + groups[2] + groups[3]
 
     def _explain_denial_enhanced(
         self,
@@ -722,47 +1320,42 @@ class OntologyValidator:
         3. Are there any rules for this role?
         """
         # Check if there are rules for action+entity with different roles
-        action_entity_rules = []
+        # (distinct roles collected in one pass, in rule order)
+        roles_for_entity: Dict[str, None] = {}
         for rule in self._rules_by_action.get(action, []):
-            if rule.entity and (rule.entity == entity or entity in rule.entity or rule.entity in entity):
-                action_entity_rules.append(rule)
-
-        if action_entity_rules:
-            allowed_roles = list(set(r.role for r in action_entity_rules if r.role))
-            if allowed_roles:
-                return {
-                    "reason": f"Action '{action}' on '{entity}' requires role(s): {', '.join(r.title() for r in allowed_roles)}. User has role '{role.title() if role else 'none'}'",
-                    "metadata": {
-                        "constraint_type": "role_mismatch",
-                        "allowed_roles": allowed_roles,
-                        "user_role": role
-                    },
-                    "suggestions": [f"{r}{action}{entity}" for r in allowed_roles[:3]]
-                }
+            if rule.role and rule.entity and (rule.entity == entity or entity in rule.entity or rule.entity in entity):
+                roles_for_entity[rule.role] = None
+
+        if roles_for_entity:
+            allowed_roles = list(roles_for_entity)
+            return {
+                "reason": f"Action '{action}' on '{entity}' requires role(s): {', '.join(r.title() for r in allowed_roles)}. User has role '{role.title() if role else 'none'}'",
+                "metadata": {
+                    "constraint_type": "role_mismatch",
+                    "allowed_roles": allowed_roles,
+                    "user_role": role
+                },
+                "suggestions": [f"{r}{action}{entity}" for r in allowed_roles[:3]]
+            }
 
         # Check if there are rules for role+action with different entities
-        role_action_rules = []
-        for rule in self._rules_by_action.get(action, []):
-            if rule.role and rule.role == role:
-                role_action_rules.append(rule)
-
-        if role_action_rules:
-            allowed_entities = list(set(r.entity for r in role_action_rules if r.entity))
-            if allowed_entities:
-                return {
-                    "reason": f"Role '{role.title()}' can '{action}' these entities: {', '.join(e.title() for e in allowed_entities[:5])}. Not '{entity}'",
-                    "metadata": {
-                        "constraint_type": "entity_mismatch",
-                        "allowed_entities": allowed_entities,
-                        "requested_entity": entity
-                    },
-                    "suggestions": [f"{role}{action}{e}" for e in allowed_entities[:3]]
-                }
+        role_action_entities = self._entities_by_action_role.get((action, role))
+
+        if role_action_entities:
+            allowed_entities = list(role_action_entities)
+            return {
+                "reason": f"Role '{role.title()}' can '{action}' these entities: {', '.join(e.title() for e in allowed_entities[:5])}. Not '{entity}'",
+                "metadata": {
+                    "constraint_type": "entity_mismatch",
+                    "allowed_entities": allowed_entities,
+                    "requested_entity": entity
+                },
+                "suggestions": [f"{role}{action}{e}" for e in allowed_entities[:3]]
+            }
 
         # Check what actions this role can do
-        role_rules = self._rules_by_role.get(role, [])
-        if role_rules:
-            allowed_actions = list(set(r.action for r in role_rules if r.action))
+        if self._rules_by_role.get(role):
+            allowed_actions = list(self._actions_by_role.get(role, ()))
             return {
                 "reason": f"Role '{role.title()}' cannot '{action}' '{entity}'. Allowed actions: {', '.join(allowed_actions[:5])}",
                 "metadata": {
@@ -791,25 +1384,25 @@ class OntologyValidator:
 
         Enhanced to use indexed rule lookup.
         """
-        if not self._loaded or self.graph is None:
+        if not self._loaded:
             raise RuntimeError("Ontology not loaded. Cannot query allowed actions.")
 
-        logger.debug(f"Querying allowed actions for entity type '{entity}'")
+        logger.debug("Querying allowed actions for entity type '%s'", entity)
 
-        entity_lower = entity.lower().strip()
-        allowed_actions = []
+        entity_lower = _normalize_key(entity)
+        cached = self._allowed_actions_cache.get(entity_lower)
+        if cached is not None:
+            return list(cached)
 
         # Use indexed lookup
-        entity_rules = self._rules_by_entity.get(entity_lower, [])
-
-        for rule in entity_rules:
-            allowed_actions.append(rule.name)
+        allowed_actions = [rule.name for rule in self._rules_by_entity.get(entity_lower, ())]
 
         # Fallback: if no indexed rules, try simple method
         if not allowed_actions:
             allowed_actions = self._find_actions_for_entity_simple(entity)
 
-        logger.info(f"Found {len(allowed_actions)} allowed actions for entity '{entity}'")
+        logger.info("Found %d allowed actions for entity '%s'", len(allowed_actions), entity)
+        self._memoize(self._allowed_actions_cache, entity_lower, tuple(allowed_actions))
         return allowed_actions
 
     def check_permissions(
@@ -823,14 +1416,14 @@ class OntologyValidator:
 
         Enhanced with precise matching.
         """
-        if not self._loaded or self.graph is None:
+        if not self._loaded:
             return True
 
-        action_lower = action.lower().strip()
-        entity_lower = entity_type.lower().strip()
-        role_lower = role.lower().strip()
+        action_lower = _normalize_key(action)
+        entity_lower = _normalize_key(entity_type)
+        role_lower = _normalize_key(role)
 
-        matching_rules = self._find_matching_rules(action_lower, entity_lower, role_lower)
+        matching_rules = self._matching_rules(action_lower, entity_lower, role_lower)
         return len(matching_rules) > 0
 
     def explain_denial(
@@ -842,90 +1435,120 @@ class OntologyValidator:
         """
         Provide a detailed explanation of why an action was denied.
         """
-        if not self._loaded or self.graph is None:
+        if not self._loaded:
             raise RuntimeError("Ontology not loaded. Cannot explain denial.")
 
-        logger.debug(f"Generating denial explanation for action '{action}' on entity '{entity}'")
+        logger.debug("Generating denial explanation for action '%s' on entity '%s'", action, entity)
 
-        user_role = context.get("role", "").lower().strip()
+        # Everything below is answered from the rule indices and memos;
+        # no graph query is needed to explain a denial
+        action_lower = _normalize_key(action)
+        entity_lower = _normalize_key(entity)
+        user_role = _normalize_key(context.get("role", ""))
+        action_exists = self._check_action_exists(action_lower)
+        entity_valid = self._check_entity_type(entity_lower)
         explanations = []
 
         # Check each validation step
-        if not self._check_action_exists(action):
+        if not action_exists:
             explanations.append(f"❌ Action '{action}' is not recognized in the ontology.")
 
-        if not self._check_entity_type(entity):
+        if not entity_valid:
             explanations.append(f"❌ Entity type '{entity}' is not recognized in the ontology.")
 
-        if self._check_action_exists(action) and self._check_entity_type(entity):
-            denial_info = self._explain_denial_enhanced(
-                action.lower(), entity.lower(), user_role
-            )
+        if action_exists and entity_valid:
+            denial_info = self._explain_denial_enhanced(action_lower, entity_lower, user_role)
             explanations.append(f"❌ {denial_info['reason']}")
 
         # Context info
         if context:
             explanations.append("\n📋 Context information:")
-            for key, value in context.items():
-                explanations.append(f"   - {key}: {value}")
+            explanations.extend(f"   - {key}: {value}" for key, value in context.items())
 
         # Suggestions
         allowed = self.get_allowed_actions(entity, context)
         if allowed:
             explanations.append(f"\n💡 Suggested alternatives:")
-            for alt_action in allowed[:5]:
-                explanations.append(f"   - {alt_action}")
+            explanations.extend(f"   - {alt_action}" for alt_action in allowed[:5])
 
         if not explanations:
             return f"Action '{action}' on entity '{entity}' was denied."
 
         return "\n".join(explanations)
 
-    def _check_action_exists(self, action: str) -> bool:
-        """Check if an action exists in the ontology."""
-        if self.graph is None:
+    def _check_action_exists(self, action_lower: str) -> bool:
+        """Check if an action (lowercase, stripped) exists in the ontology."""
+        if not self._loaded:
             return False
 
-        action_lower = action.lower().strip()
+        # Every indexed action is also recorded in _known_actions
+        return action_lower in self._known_actions
 
-        # Check in indexed actions
-        if action_lower in self._rules_by_action:
-            return True
+    def _check_entity_type(self, entity_lower: str) -> bool:
+        """Check if an entity type (lowercase, stripped) exists in the ontology."""
+        if not self._loaded:
+            return False
 
-        # Check in known actions
-        if action_lower in self._known_actions:
+        # Indexed rule entities and ontology classes, merged at parse time
+        if entity_lower in self._entity_names:
             return True
 
-        return False
-
-    def _check_entity_type(self, entity: str) -> bool:
-        """Check if an entity type exists in the ontology."""
-        if self.graph is None:
-            return False
+        cached = self._entity_check_cache.get(entity_lower)
+        if cached is not None:
+            return cached
 
-        entity_lower = entity.lower().strip()
+        found = self._partial_entity_match(entity_lower)
+        self._memoize(self._entity_check_cache, entity_lower, found)
+        return found
 
-        # Check in indexed entities
-        if entity_lower in self._rules_by_entity:
-            return True
+    def _partial_entity_match(self, entity_lower: str) -> bool:
+        """
+        Whether some known entity contains entity_lower or is contained in it.
 
-        # Check in known entities
-        if entity_lower in self._known_entities:
-            return True
+        Small catalogs are scanned directly. Larger ones use the trigram
+        index for "contains" (only entities holding every trigram of the
+        query can contain it) and probe the query's substrings of known
+        entity lengths for "contained in".
+        """
+        known_entities = self._known_entities
+        if len(known_entities) < self.ENTITY_SCAN_LIMIT or len(entity_lower) < 3:
+            return any(
+                entity_lower in known_entity or known_entity in entity_lower
+                for known_entity in known_entities
+            )
 
-        # Check for partial match
-        for known_entity in self._known_entities:
-            if entity_lower == known_entity or entity_lower in known_entity or known_entity in entity_lower:
+        # Known entity contains the query
+        postings = []
+        for i in range(len(entity_lower) - 2):
+            posting = self._entity_trigrams.get(entity_lower[i:i + 3])
+            if not posting:
+                postings = []
+                break
+            postings.append(posting)
+        if postings:
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            if any(entity_lower in candidate for candidate in candidates):
                 return True
 
+        # Query contains a known entity
+        for length in self._entity_lengths:
+            if length > len(entity_lower):
+                break
+            for start in range(len(entity_lower) - length + 1):
+                if entity_lower[start:start + length] in known_entities:
+                    return True
         return False
 
     def _check_action_allowed_for_entity(self, action: str, entity: str) -> bool:
         """Check if an action is allowed for a specific entity type."""
-        if self.graph is None:
+        if not self._loaded:
             return False
 
-        return self._check_action_exists(action) and self._check_entity_type(entity)
+        return (
+            self._check_action_exists(_normalize_key(action))
+            and self._check_entity_type(_normalize_key(entity))
+        )
 
     def _check_constraints(
         self,
@@ -940,11 +1563,11 @@ class OntologyValidator:
         This method is kept for backwards compatibility but the main
         validation logic now uses _find_matching_rules.
         """
-        if self.graph is None:
+        if not self._loaded:
             return {"allowed": True}
 
-        user_role = context.get("role", "").lower().strip()
-        matching_rules = self._find_matching_rules(
+        user_role = _normalize_key(context.get("role", ""))
+        matching_rules = self._matching_rules(
             action.lower(), entity.lower(), user_role
         )
 
@@ -963,36 +1586,47 @@ class OntologyValidator:
             "suggested_actions": denial_info.get("suggestions", [])
         }
 
-    def _suggest_similar_actions(self, action: str) -> List[str]:
-        """Suggest similar actions if the requested action doesn't exist."""
-        if self.graph is None:
+    def _suggest_similar_actions(self, action_lower: str) -> List[str]:
+        """Suggest similar actions (for a lowercase action name) if it doesn't exist."""
+        if not self._loaded:
             return []
 
-        action_lower = action.lower()
-        suggestions = []
+        cached = self._suggestion_cache.get(action_lower)
+        if cached is not None:
+            return list(cached)
 
-        for known_action in self._known_actions:
+        # Known actions in sorted order, so the first five are stable across runs
+        suggestions = []
+        for known_action in self._default_actions:
             if action_lower in known_action or known_action in action_lower:
                 suggestions.append(known_action)
+                if len(suggestions) == 5:
+                    break
 
-        return suggestions[:5]
+        # Then likely misspellings (e.g. 'crete' -> 'create'), closest first
+        if len(suggestions) < 5:
+            for close_action in difflib.get_close_matches(action_lower, self._default_actions, n=5, cutoff=0.75):
+                if close_action not in suggestions:
+                    suggestions.append(close_action)
+            del suggestions[5:]
+
+        self._memoize(self._suggestion_cache, action_lower, tuple(suggestions))
+        return suggestions
 
     def _find_actions_for_entity_simple(self, entity: str) -> List[str]:
         """Find actions for an entity using parsed action rules."""
         if not self._action_rules:
             return []
 
-        entity_lower = entity.lower().strip()
-        actions = []
-
-        for action_name, rule in self._action_rules.items():
-            applies_to = rule.get("appliesTo", "").lower() if rule.get("appliesTo") else ""
-
-            if not applies_to or applies_to == entity_lower or entity_lower in applies_to or applies_to in entity_lower:
-                actions.append(action_name)
+        entity_lower = _normalize_key(entity)
+        actions = [
+            action_name for action_name, applies_to in self._action_targets
+            if not applies_to or applies_to == entity_lower or entity_lower in applies_to or applies_to in entity_lower
+        ]
 
-        if not actions and self._known_actions:
-            return list(self._known_actions)
+        # Nothing targets this entity: offer every known action, in a stable order
+        if not actions:
+            return list(self._default_actions)
 
         return actions
 
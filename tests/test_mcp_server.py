@@ -12,10 +12,9 @@ This test suite validates the MCP server functionality, including:
 import pytest
 import sys
 import os
-import tempfile
 import yaml
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -27,17 +26,16 @@ from ontoguard.mcp_server import (
     get_allowed_actions,
     explain_rule,
     check_permissions,
-    _validator,
-    _config
 )
 # Import the actual implementations (not the decorated versions)
 from ontoguard.mcp_server import (
     _validate_action_impl,
+    _validate_actions_bulk_impl,
     _get_allowed_actions_impl,
     _explain_rule_impl,
     _check_permissions_impl
 )
-from ontoguard import OntologyValidator
+from ontoguard import OntologyValidator, mcp_server
 
 
 # ============================================================================
@@ -85,18 +83,16 @@ def sample_config_relative(sample_ontology_path, tmp_path):
 @pytest.fixture
 def reset_validator():
     """Fixture to reset the global validator state between tests."""
-    from ontoguard.mcp_server import _validator, _config
-    import ontoguard.mcp_server
     
-    original_validator = _validator
-    original_config = _config.copy() if _config else {}
+    original_validator = mcp_server._validator
+    original_config = mcp_server._config.copy() if mcp_server._config else {}
     
     yield
     
     # Restore original state
-    ontoguard.mcp_server._validator = original_validator
-    _config.clear()
-    _config.update(original_config)
+    mcp_server._validator = original_validator
+    mcp_server._config.clear()
+    mcp_server._config.update(original_config)
 
 
 # ============================================================================
@@ -145,6 +141,25 @@ class TestConfigurationLoading:
         
         config = load_config(str(empty_config))
         assert config == {}
+    
+    def test_load_config_cached_until_modified(self, sample_config):
+        """Test that repeated loads reuse the parse until the file changes."""
+        from ontoguard.mcp_server import _read_yaml
+        
+        first = load_config(sample_config)
+        first["log_level"] = "DEBUG"
+        hits_before = _read_yaml.cache_info().hits
+        second = load_config(sample_config)
+        
+        assert _read_yaml.cache_info().hits == hits_before + 1
+        assert second["log_level"] == "INFO"
+        
+        with open(sample_config, 'a') as f:
+            f.write("log_level: WARNING\n")
+        stat = os.stat(sample_config)
+        os.utime(sample_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert load_config(sample_config)["log_level"] == "WARNING"
 
 
 # ============================================================================
@@ -156,9 +171,8 @@ class TestValidatorInitialization:
     
     def test_initialize_validator_success(self, sample_ontology_path, reset_validator):
         """Test successful validator initialization."""
-        from ontoguard.mcp_server import _config
-        _config.clear()
-        _config.update({"ontology_path": sample_ontology_path})
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         validator = initialize_validator()
         
@@ -168,32 +182,27 @@ class TestValidatorInitialization:
     
     def test_initialize_validator_missing_ontology_path(self, reset_validator):
         """Test error when ontology_path is not in config."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._validator = None
         
         with pytest.raises(ValueError, match="ontology_path not specified"):
             initialize_validator()
     
     def test_initialize_validator_nonexistent_file(self, reset_validator):
         """Test error when ontology file doesn't exist."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        _config.update({"ontology_path": "nonexistent.owl"})
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": "nonexistent.owl"})
+        mcp_server._validator = None
         
         with pytest.raises(FileNotFoundError):
             initialize_validator()
     
     def test_initialize_validator_relative_path(self, sample_config_relative, reset_validator):
         """Test validator initialization with relative path."""
-        from ontoguard.mcp_server import _config
         config = load_config(sample_config_relative)
-        _config.clear()
-        _config.update(config)
-        _config["_config_file"] = sample_config_relative
+        mcp_server._config.clear()
+        mcp_server._config.update(config)
+        mcp_server._config["_config_file"] = sample_config_relative
         
         # This should work if we're in the right directory
         try:
@@ -205,17 +214,100 @@ class TestValidatorInitialization:
     
     def test_initialize_validator_caching(self, sample_ontology_path, reset_validator):
         """Test that validator is cached after first initialization."""
-        from ontoguard.mcp_server import _config, _validator
-        _config.clear()
-        _config.update({"ontology_path": sample_ontology_path})
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         # Reset validator
-        import ontoguard.mcp_server
-        ontoguard.mcp_server._validator = None
+        mcp_server._validator = None
         
         validator1 = initialize_validator()
         validator2 = initialize_validator()
         
         assert validator1 is validator2  # Same instance
+    
+    def test_initialize_validator_concurrent(self, sample_ontology_path, reset_validator):
+        """Test that concurrent first calls parse the ontology only once."""
+        import threading
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        barrier = threading.Barrier(4)
+        results = []
+        
+        def worker():
+            barrier.wait()
+            results.append(initialize_validator())
+        
+        with patch("ontoguard.mcp_server.OntologyValidator", wraps=OntologyValidator) as ctor:
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert ctor.call_count == 1
+        assert len(results) == 4
+        assert all(v is results[0] for v in results)
+    
+    def test_initialize_validator_cache_dir(self, sample_ontology_path, reset_validator, tmp_path):
+        """Test that validator_cache_dir lets a restart skip parsing the ontology."""
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path, "validator_cache_dir": str(tmp_path)})
+        mcp_server._validator = None
+        
+        first = initialize_validator()
+        assert list(tmp_path.glob("*.validator.pkl"))
+        
+        mcp_server._validator = None
+        with patch.object(OntologyValidator, "_load_ontology", side_effect=AssertionError("parsed again")):
+            second = initialize_validator()
+        
+        assert second is not first
+        assert second._known_actions == first._known_actions
+    
+    def test_initialize_validator_stale_cache_entry(self, sample_ontology_path, reset_validator, tmp_path):
+        """Test that a cache entry from an older build does not break startup."""
+        import pickle
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path, "validator_cache_dir": str(tmp_path)})
+        mcp_server._validator = None
+        
+        initialize_validator()
+        (cache_file,) = tmp_path.glob("*.validator.pkl")
+        with open(cache_file, 'rb') as f:
+            stale = pickle.load(f)
+        del stale.__dict__['_decision_cache']
+        with open(cache_file, 'wb') as f:
+            pickle.dump(stale, f)
+        
+        mcp_server._validator = None
+        validator = initialize_validator()
+        
+        assert validator.validate("create", "Order", "o1", {"role": "Customer"}).allowed
+    
+    def test_warm_up_validator(self, sample_ontology_path, reset_validator):
+        """Test that warm-up builds the graph indices and the explain query."""
+        from ontoguard.mcp_server import warm_up_validator
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        validator = initialize_validator()
+        warm_up_validator(validator)
+        
+        assert validator._fragments is not None
+        assert mcp_server._explain_query.cache_info().currsize == 1
+    
+    def test_warm_up_cached_validator_keeps_graph_lazy(self, sample_ontology_path, reset_validator, tmp_path):
+        """Test that warming up a validator from the cache does not re-parse its graph."""
+        from ontoguard.mcp_server import warm_up_validator
+        OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        validator = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        
+        warm_up_validator(validator)
+        
+        assert validator._graph is None
+        assert validator._fragments is not None
 
 
 # ============================================================================
@@ -227,8 +319,8 @@ class TestValidateActionTool:
     
     def test_validate_action_allowed(self, sample_ontology_path, reset_validator):
         """Test validating an allowed action."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _validate_action_impl(
             action="create order",
@@ -246,8 +338,8 @@ class TestValidateActionTool:
     
     def test_validate_action_denied(self, sample_ontology_path, reset_validator):
         """Test validating a denied action."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _validate_action_impl(
             action="delete user",
@@ -263,11 +355,9 @@ class TestValidateActionTool:
     
     def test_validate_action_missing_ontology(self, reset_validator):
         """Test error handling when ontology is missing."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        _config.update({"ontology_path": "nonexistent.owl"})
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": "nonexistent.owl"})
+        mcp_server._validator = None
         
         result = _validate_action_impl(
             action="create order",
@@ -284,10 +374,8 @@ class TestValidateActionTool:
     
     def test_validate_action_invalid_config(self, reset_validator):
         """Test error handling for invalid configuration."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._validator = None
         
         result = _validate_action_impl(
             action="create order",
@@ -299,10 +387,23 @@ class TestValidateActionTool:
         assert result["allowed"] is False
         assert "configuration_error" in result.get("metadata", {}).get("error", "")
     
+    def test_validate_action_compact(self, sample_ontology_path, reset_validator):
+        """Test that compact responses carry only the decision and reason."""
+        from ontoguard.mcp_server import clear_validation_cache
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path, "cache_validations": True})
+        mcp_server._validator = None
+        clear_validation_cache()
+        
+        full = _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+        compact = _validate_action_impl("create order", "Order", "o1", {"role": "Customer"}, compact=True)
+        
+        assert compact == {"allowed": full["allowed"], "reason": full["reason"]}
+    
     def test_validate_action_with_complex_context(self, sample_ontology_path, reset_validator):
         """Test validation with complex context."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _validate_action_impl(
             action="process refund",
@@ -319,6 +420,180 @@ class TestValidateActionTool:
         assert "allowed" in result
 
 
+class TestValidationCache:
+    """Test the LRU cache around validate_action."""
+    
+    def _setup(self, sample_ontology_path, **config):
+        from ontoguard.mcp_server import clear_validation_cache
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path, **config})
+        mcp_server._validator = None
+        validator = initialize_validator()
+        clear_validation_cache()
+        return validator
+    
+    def test_repeated_call_hits_cache(self, sample_ontology_path, reset_validator):
+        """Identical requests are validated only once when caching is enabled."""
+        validator = self._setup(sample_ontology_path, cache_validations=True)
+        
+        with patch.object(validator, "validate", wraps=validator.validate) as spy:
+            first = _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+            first["reason"] = "mutated by caller"
+            second = _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+        
+        assert spy.call_count == 1
+        assert second["reason"] != "mutated by caller"
+    
+    def test_padded_arguments_share_cache_entry(self, sample_ontology_path, reset_validator):
+        """Arguments are stripped at the tool boundary before caching."""
+        validator = self._setup(sample_ontology_path, cache_validations=True)
+        
+        with patch.object(validator, "validate", wraps=validator.validate) as spy:
+            _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+            _validate_action_impl("  create order ", "Order\n", "o1", {"role": "Customer"})
+        
+        assert spy.call_count == 1
+    
+    def test_non_string_arguments_report_validation_error(self, sample_ontology_path, reset_validator):
+        """Non-string arguments get a structured error, not an exception."""
+        self._setup(sample_ontology_path, cache_validations=True)
+        
+        result = _validate_action_impl(None, "User", "customer", None)
+        
+        assert result["allowed"] is False
+        assert result["metadata"]["error"] == "validation_error"
+    
+    def test_different_context_misses_cache(self, sample_ontology_path, reset_validator):
+        """Requests that differ only in context are validated separately."""
+        validator = self._setup(sample_ontology_path, cache_validations=True)
+        
+        with patch.object(validator, "validate", wraps=validator.validate) as spy:
+            _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+            _validate_action_impl("create order", "Order", "o1", {"role": "Admin"})
+        
+        assert spy.call_count == 2
+    
+    def test_cache_evicts_least_recently_used(self, sample_ontology_path, reset_validator):
+        """The cache never grows beyond validation_cache_size."""
+        from ontoguard.mcp_server import _validation_cache
+        self._setup(sample_ontology_path, cache_validations=True, validation_cache_size=2)
+        
+        for entity_id in ["o1", "o2", "o3"]:
+            _validate_action_impl("create order", "Order", entity_id, {"role": "Customer"})
+        
+        assert len(_validation_cache) == 2
+        assert [key[2] for key in _validation_cache] == ["o2", "o3"]
+    
+    def test_allowed_actions_memoized_per_entity(self, sample_ontology_path, reset_validator):
+        """get_allowed_actions reuses the validator's per-entity result for any role."""
+        validator = self._setup(sample_ontology_path, cache_validations=True)
+        
+        first = _get_allowed_actions_impl("Order", {"role": "Customer"})
+        first["allowed_actions"].append("mutated by caller")
+        with patch.object(validator, "_find_actions_for_entity_simple", side_effect=AssertionError("not memoized")):
+            second = _get_allowed_actions_impl("order", {"role": "Admin"})
+        
+        assert "mutated by caller" not in second["allowed_actions"]
+        assert second["allowed_actions"] == first["allowed_actions"][:-1]
+    
+    def test_cache_disabled(self, sample_ontology_path, reset_validator):
+        """Without cache_validations every request is validated."""
+        validator = self._setup(sample_ontology_path, cache_validations=False)
+        
+        with patch.object(validator, "validate", wraps=validator.validate) as spy:
+            _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+            _validate_action_impl("create order", "Order", "o1", {"role": "Customer"})
+        
+        assert spy.call_count == 2
+
+
+# ============================================================================
+# VALIDATE_ACTIONS_BULK TOOL TESTS
+# ============================================================================
+
+class TestValidateActionsBulkTool:
+    """Test the validate_actions_bulk MCP tool."""
+    
+    def test_bulk_matches_single_validation(self, sample_ontology_path, reset_validator):
+        """Test that bulk results match individual validate_action calls."""
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        requests = [
+            {"action": "create order", "entity": "Order", "entity_id": "o1", "context": {"role": "Customer"}},
+            {"action": "delete user", "entity": "User", "entity_id": "u1", "context": {"role": "Customer"}},
+        ]
+        
+        result = _validate_actions_bulk_impl(requests)
+        
+        assert result["count"] == 2
+        for request, item in zip(requests, result["results"]):
+            single = _validate_action_impl(**request)
+            assert item["allowed"] == single["allowed"]
+            assert item["reason"] == single["reason"]
+        assert result["allowed_count"] == sum(r["allowed"] for r in result["results"])
+    
+    def test_bulk_with_workers(self, sample_ontology_path, reset_validator):
+        """Test that a thread pool returns the same results in request order."""
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        requests = [
+            {"action": action, "entity": entity, "entity_id": f"id_{i}", "context": {"role": role}}
+            for i, (action, entity, role) in enumerate([
+                ("create order", "Order", "Customer"),
+                ("delete user", "User", "Customer"),
+                ("delete user", "User", "Admin"),
+                ("process refund", "Refund", "Manager"),
+            ])
+        ]
+        
+        sequential = _validate_actions_bulk_impl(requests)
+        mcp_server._config["workers"] = 4
+        parallel = _validate_actions_bulk_impl(requests)
+        
+        assert parallel == sequential
+    
+    def test_bulk_executor_replaced_on_resize(self):
+        """Test that one pool is shared per size and a resized pool is shut down."""
+        first = mcp_server._bulk_executor(2)
+        assert mcp_server._bulk_executor(2) is first
+        
+        second = mcp_server._bulk_executor(3)
+        
+        assert second is not first
+        assert first._shutdown
+        assert list(second.map(abs, [-1, -2])) == [1, 2]
+    
+    def test_bulk_invalid_item(self, sample_ontology_path, reset_validator):
+        """Test that a malformed request fails alone without aborting the batch."""
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        result = _validate_actions_bulk_impl([
+            {"entity": "Order"},
+            {"action": "create order", "entity": "Order", "context": {"role": "Customer"}},
+        ])
+        
+        assert result["count"] == 2
+        assert result["results"][0]["allowed"] is False
+        assert result["results"][0]["metadata"]["error"] == "validation_error"
+        assert "reason" in result["results"][1]
+    
+    def test_bulk_invalid_config(self, reset_validator):
+        """Test error handling when the validator cannot be initialized."""
+        mcp_server._config.clear()
+        mcp_server._validator = None
+        
+        result = _validate_actions_bulk_impl([{"action": "create order", "entity": "Order"}])
+        
+        assert result["results"] == []
+        assert "error" in result
+
+
 # ============================================================================
 # GET_ALLOWED_ACTIONS TOOL TESTS
 # ============================================================================
@@ -328,8 +603,8 @@ class TestGetAllowedActionsTool:
     
     def test_get_allowed_actions_success(self, sample_ontology_path, reset_validator):
         """Test getting allowed actions successfully."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _get_allowed_actions_impl(
             entity="Order",
@@ -347,8 +622,8 @@ class TestGetAllowedActionsTool:
     
     def test_get_allowed_actions_empty_result(self, sample_ontology_path, reset_validator):
         """Test getting allowed actions for unknown entity."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _get_allowed_actions_impl(
             entity="UnknownEntity",
@@ -361,8 +636,8 @@ class TestGetAllowedActionsTool:
     
     def test_get_allowed_actions_with_role_context(self, sample_ontology_path, reset_validator):
         """Test getting allowed actions with role context."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _get_allowed_actions_impl(
             entity="User",
@@ -375,11 +650,9 @@ class TestGetAllowedActionsTool:
     
     def test_get_allowed_actions_ontology_not_loaded(self, reset_validator):
         """Test error handling when ontology is not loaded."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        _config.update({"ontology_path": "nonexistent.owl"})
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": "nonexistent.owl"})
+        mcp_server._validator = None
         
         result = _get_allowed_actions_impl(
             entity="Order",
@@ -401,8 +674,8 @@ class TestExplainRuleTool:
     
     def test_explain_rule_success(self, sample_ontology_path, reset_validator):
         """Test explaining a rule successfully."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _explain_rule_impl("DeleteUser")
         
@@ -418,10 +691,53 @@ class TestExplainRuleTool:
         assert isinstance(result["applies_to"], list)
         assert isinstance(result["found"], bool)
     
+    def test_explain_rule_matches_action_spelling(self, sample_ontology_path, reset_validator):
+        """Test that a misspelled rule name falls back to the closest action rule."""
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        result = _explain_rule_impl("Delete Usr")
+        
+        assert result["found"] is True
+        assert "Action: delete user" in result["explanation"]
+    
+    @pytest.mark.parametrize("ontology,rule_name", [
+        ("ecommerce.owl", "DeleteUser"),
+        ("ecommerce.owl", "hasOrder"),
+        ("finance.owl", "InternationalTransferRequiresCompliance"),
+        ("finance.owl", "isInternational"),
+        ("finance.owl", "Account"),
+        ("healthcare.owl", "SensitiveRecord"),
+    ])
+    def test_explain_rule_resolves_own_uri(self, ontology, rule_name, reset_validator):
+        """Test that a class, property or constraint name resolves to its own URI."""
+        ontology_path = Path(__file__).parent.parent / "examples" / "ontologies" / ontology
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": str(ontology_path)})
+        mcp_server._validator = None
+        
+        result = _explain_rule_impl(rule_name)
+        
+        assert result["found"] is True
+        assert result["explanation"].startswith(f"Found: {rule_name}\n")
+        assert f"#{rule_name}\n" in result["explanation"] or result["explanation"].endswith(f"#{rule_name}")
+        assert "Action:" not in result["explanation"]
+    
+    def test_explain_rule_no_loose_match(self, sample_ontology_path, reset_validator):
+        """Test that an unrelated name is not resolved to some similar action."""
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
+        mcp_server._validator = None
+        
+        result = _explain_rule_impl("Discount")
+        
+        assert result["found"] is False
+    
     def test_explain_rule_not_found(self, sample_ontology_path, reset_validator):
         """Test explaining a rule that doesn't exist."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _explain_rule_impl("NonExistentRule")
         
@@ -432,11 +748,9 @@ class TestExplainRuleTool:
     
     def test_explain_rule_ontology_not_loaded(self, reset_validator):
         """Test error handling when ontology is not loaded."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        _config.update({"ontology_path": "nonexistent.owl"})
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": "nonexistent.owl"})
+        mcp_server._validator = None
         
         result = _explain_rule_impl("SomeRule")
         
@@ -445,8 +759,8 @@ class TestExplainRuleTool:
     
     def test_explain_rule_various_names(self, sample_ontology_path, reset_validator):
         """Test explaining rules with various naming formats."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         test_cases = ["User", "Order", "ProcessRefund", "delete user"]
         
@@ -465,8 +779,8 @@ class TestCheckPermissionsTool:
     
     def test_check_permissions_allowed(self, sample_ontology_path, reset_validator):
         """Test checking permissions for an allowed action."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _check_permissions_impl(
             user_role="Admin",
@@ -487,8 +801,8 @@ class TestCheckPermissionsTool:
     
     def test_check_permissions_denied(self, sample_ontology_path, reset_validator):
         """Test checking permissions for a denied action."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _check_permissions_impl(
             user_role="Customer",
@@ -503,8 +817,8 @@ class TestCheckPermissionsTool:
     
     def test_check_permissions_with_manager(self, sample_ontology_path, reset_validator):
         """Test checking permissions for Manager role."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _check_permissions_impl(
             user_role="Manager",
@@ -517,11 +831,9 @@ class TestCheckPermissionsTool:
     
     def test_check_permissions_ontology_not_loaded(self, reset_validator):
         """Test error handling when ontology is not loaded."""
-        from ontoguard.mcp_server import _config
-        import ontoguard.mcp_server
-        _config.clear()
-        _config.update({"ontology_path": "nonexistent.owl"})
-        ontoguard.mcp_server._validator = None
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": "nonexistent.owl"})
+        mcp_server._validator = None
         
         result = _check_permissions_impl(
             user_role="Admin",
@@ -531,6 +843,27 @@ class TestCheckPermissionsTool:
         
         assert result["has_permission"] is False
         # May or may not have error key depending on when exception occurs
+    
+    def test_check_permissions_infers_configured_role(self, sample_ontology_path, reset_validator):
+        """Test inferring required roles from the reason using known_roles."""
+        from ontoguard import ValidationResult
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path, "known_roles": ["auditor", "admin"]})
+        mcp_server._validator = None
+        validator = initialize_validator()
+        
+        denial = ValidationResult(
+            allowed=False,
+            reason="Action requires role 'Auditor', but user has role 'Administrator'"
+        )
+        with patch.object(validator, "validate", return_value=denial):
+            result = _check_permissions_impl(
+                user_role="Administrator",
+                action="export ledger",
+                entity="Ledger"
+            )
+        
+        assert result["required_roles"] == ["Auditor"]
 
 
 # ============================================================================
@@ -542,8 +875,8 @@ class TestMCPServerIntegration:
     
     def test_full_workflow(self, sample_ontology_path, reset_validator):
         """Test a complete workflow using multiple tools."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         # 1. Check permissions
         perm_result = check_permissions(
@@ -575,16 +908,16 @@ class TestMCPServerIntegration:
     
     def test_error_recovery(self, sample_ontology_path, reset_validator):
         """Test that tools recover gracefully from errors."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         # First, cause an error with invalid config
-        _config = {}
+        mcp_server._config = {}
         result1 = validate_action("test", "Test", "test_1", {})
         assert result1["allowed"] is False
         
         # Then fix config and try again
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config = {"ontology_path": sample_ontology_path}
         result2 = validate_action("create order", "Order", "order_1", {"role": "Customer"})
         assert isinstance(result2, dict)
         assert "allowed" in result2
@@ -599,8 +932,8 @@ class TestEdgeCases:
     
     def test_validate_action_empty_strings(self, sample_ontology_path, reset_validator):
         """Test validation with empty strings."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _validate_action_impl(
             action="",
@@ -614,8 +947,8 @@ class TestEdgeCases:
     
     def test_validate_action_none_context(self, sample_ontology_path, reset_validator):
         """Test validation with None context (should use empty dict)."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         # Context should be a dict, but test with None handling
         result = _validate_action_impl(
@@ -629,8 +962,8 @@ class TestEdgeCases:
     
     def test_get_allowed_actions_empty_context(self, sample_ontology_path, reset_validator):
         """Test getting allowed actions with empty context."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _get_allowed_actions_impl(
             entity="Order",
@@ -642,8 +975,8 @@ class TestEdgeCases:
     
     def test_explain_rule_empty_string(self, sample_ontology_path, reset_validator):
         """Test explaining rule with empty string."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _explain_rule_impl("")
         
@@ -652,8 +985,8 @@ class TestEdgeCases:
     
     def test_check_permissions_special_characters(self, sample_ontology_path, reset_validator):
         """Test check permissions with special characters in role name."""
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         result = _check_permissions_impl(
             user_role="Admin@123",
@@ -675,8 +1008,8 @@ class TestLogging:
     def test_logging_on_validation(self, sample_ontology_path, reset_validator, caplog):
         """Test that validation requests are logged."""
         import logging
-        global _config
-        _config = {"ontology_path": sample_ontology_path}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": sample_ontology_path})
         
         with caplog.at_level(logging.INFO):
             validate_action(
@@ -692,8 +1025,8 @@ class TestLogging:
     def test_logging_on_error(self, reset_validator, caplog):
         """Test that errors are logged."""
         import logging
-        global _config
-        _config = {"ontology_path": "nonexistent.owl"}
+        mcp_server._config.clear()
+        mcp_server._config.update({"ontology_path": "nonexistent.owl"})
         
         with caplog.at_level(logging.ERROR):
             validate_action(
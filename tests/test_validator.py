@@ -8,6 +8,7 @@ including ontology loading, validation logic, constraint checking, and error han
 import pytest
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -165,6 +166,207 @@ class TestOntologyLoading:
         finally:
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_from_graph_matches_file_load(self, validator, sample_ontology_path):
+        """
+        Test building a validator from an already-parsed graph.
+
+        This test verifies that:
+        - No file parsing is needed when a graph is supplied
+        - Rules parsed from the graph match those from a normal load
+        """
+        rebuilt = OntologyValidator.from_graph(validator.graph, sample_ontology_path)
+
+        assert rebuilt._loaded is True
+        assert rebuilt.graph is validator.graph
+        assert rebuilt._known_actions == validator._known_actions
+        assert rebuilt._known_entities == validator._known_entities
+        assert len(rebuilt._parsed_rules) == len(validator._parsed_rules)
+
+    def test_load_cached(self, sample_ontology_path, tmp_path):
+        """
+        Test that a second load of the same file comes from the validator cache.
+
+        This test verifies that:
+        - The first load writes a cache entry
+        - The second load skips parsing and gives the same rules
+        """
+        first = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        assert len(list(tmp_path.glob("*.validator.pkl"))) == 1
+
+        with patch.object(OntologyValidator, "_load_ontology", side_effect=AssertionError("parsed again")):
+            second = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+
+        assert second is not first
+        assert second._known_actions == first._known_actions
+        assert len(second._parsed_rules) == len(first._parsed_rules)
+        assert second.validate("create", "Order", "o1", {"role": "Customer"}).allowed
+
+    def test_load_cached_graph_is_lazy(self, sample_ontology_path, tmp_path):
+        """
+        Test that a cached validator re-parses its graph only when it is read.
+        """
+        first = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        second = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+
+        assert second._graph is None
+        assert second.triple_count == first.triple_count
+        assert second.validate("create", "Order", "o1", {"role": "Customer"}).allowed
+        assert second._graph is None
+
+        # Graph indices travel with the cache entry
+        second._build_indices()
+        assert second._graph is None
+        assert second._by_type == first._by_type
+        assert second._labels == first._labels
+
+        assert len(second.graph) == len(first.graph)
+        assert second._graph is not None
+
+    def test_load_cached_graph_parses_once_across_threads(self, sample_ontology_path, tmp_path):
+        """
+        Test that threads reading a cached validator's graph share one re-parse.
+        """
+        OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        cached = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+
+        with patch.object(Graph, "parse", autospec=True, side_effect=Graph.parse) as parse:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                graphs = list(pool.map(lambda _: cached.graph, range(16)))
+
+        assert parse.call_count == 1
+        assert all(graph is graphs[0] for graph in graphs)
+
+    def test_load_cached_rebuilds_stale_entries(self, sample_ontology_path, tmp_path):
+        """
+        Test that cache entries from another build are never reused.
+
+        This test verifies that:
+        - The cache key includes the package version and CACHE_FORMAT
+        - An entry missing state this version expects is rebuilt, not returned
+        """
+        import pickle
+        from ontoguard import __version__
+
+        OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        (cache_file,) = tmp_path.glob("*.validator.pkl")
+        assert f".{__version__}-{OntologyValidator.CACHE_FORMAT}." in cache_file.name
+
+        # Simulate an entry written before _decision_cache existed
+        with open(cache_file, 'rb') as f:
+            stale = pickle.load(f)
+        del stale.__dict__['_decision_cache']
+        with open(cache_file, 'wb') as f:
+            pickle.dump(stale, f)
+
+        rebuilt = OntologyValidator.load_cached(sample_ontology_path, tmp_path)
+        assert rebuilt.validate("create", "Order", "o1", {"role": "Customer"}).allowed
+
+        with open(cache_file, 'rb') as f:
+            assert '_decision_cache' in vars(pickle.load(f))
+
+    def test_build_indices(self, validator):
+        """
+        Test the single-pass rdf:type and rdfs:label indices.
+
+        This test verifies that:
+        - Subjects are bucketed by rdf:type like graph.subjects() would
+        - Labels are collected for labelled resources
+        - Subject URIs are indexed by lowercased fragment
+        """
+        from rdflib import URIRef
+        from rdflib.namespace import RDF, RDFS, OWL
+
+        validator._build_indices()
+
+        classes = validator._by_type.get(OWL.Class, [])
+        assert set(classes) == set(validator.graph.subjects(RDF.type, OWL.Class))
+        assert validator._typed_subject_count == len(set(validator.graph.subjects(RDF.type, None)))
+        for subj, label in validator._labels.items():
+            assert (subj, RDFS.label, None) in validator.graph
+
+        indexed = {subj for subjects in validator._fragments.values() for subj in subjects}
+        assert indexed == {s for s in validator.graph.subjects() if isinstance(s, URIRef)}
+        for fragment, subjects in validator._fragments.items():
+            assert all(str(subj).lower().endswith(fragment) for subj in subjects)
+
+    def test_match_fragment(self, validator):
+        """
+        Test fragment lookup against a straightforward scan of the index.
+
+        Exact fragments win; otherwise the first fragment containing, or
+        contained in, the needle is returned.
+        """
+        validator._build_indices()
+        fragments = validator._fragments
+
+        def scan(needle):
+            if needle in fragments:
+                return fragments[needle][0]
+            for fragment, subjects in fragments.items():
+                if needle in fragment or fragment in needle:
+                    return subjects[0]
+            return None
+
+        needles = ["nonexistentrule", "q" * 40]
+        for fragment in fragments:
+            needles += [fragment, fragment[1:4], fragment + "xx", "zz" + fragment + "q"]
+
+        for needle in needles:
+            assert validator._match_fragment(needle) == scan(needle), needle
+
+    def test_partial_entity_match(self, validator):
+        """
+        Test that the trigram path agrees with a plain scan of known entities.
+        """
+        known = validator._known_entities
+
+        def scan(needle):
+            return any(needle in entity or entity in needle for entity in known)
+
+        needles = ["", "or", "zzzzzz", "customerorderhistory", "xxorderxx"]
+        for entity in known:
+            needles += [entity, entity[1:-1], entity[:4], "pre" + entity + "post", entity[::-1]]
+
+        with patch.object(OntologyValidator, "ENTITY_SCAN_LIMIT", 0):
+            for needle in needles:
+                assert validator._partial_entity_match(needle) == scan(needle), needle
+
+    def test_find_property_uri(self, validator, temp_ontology_file):
+        """
+        Test property lookup by local name, in and outside the base namespace.
+        """
+        from rdflib import Namespace, URIRef
+
+        # ecommerce.owl declares its properties outside the ontology namespace
+        expected = URIRef("http://example.org/requiresRole")
+        assert validator._find_property_uri("requiresRole") == expected
+        assert validator._find_property_uri("REQUIRESROLE") == expected
+        assert validator._find_property_uri("noSuchProperty") is None
+
+        base = Namespace("http://example.org/test#")
+        other = OntologyValidator(temp_ontology_file)
+        other.graph.add((base.Rule, base.requiresRole, base.Admin))
+        other._predicates_by_name = None
+        assert other._find_property_uri("requiresRole") == base.requiresRole
+
+    def test_detect_base_namespace_without_ontology_header(self, validator):
+        """
+        Test that the majority class namespace is used when owl:Ontology is missing.
+        """
+        from rdflib import Namespace, RDF
+        from rdflib.namespace import OWL
+
+        main, other = Namespace("http://example.org/main#"), Namespace("http://example.org/other#")
+        graph = Graph()
+        for name in ["A", "B", "C"]:
+            graph.add((main[name], RDF.type, OWL.Class))
+        graph.add((other.D, RDF.type, OWL.Class))
+        validator.graph = graph
+        assert validator._detect_base_namespace() == "http://example.org/main#"
+
+        with patch.object(OntologyValidator, "NAMESPACE_SAMPLE_SIZE", 0):
+            assert validator._detect_base_namespace() is None
+
 
 # ============================================================================
 # VALIDATION TESTS
@@ -242,6 +444,51 @@ class TestValidation:
         assert isinstance(result.reason, str)
         assert isinstance(result.suggested_actions, list)
     
+    def test_validate_suggests_misspelled_actions(self, validator):
+        """
+        Test that an undefined but misspelled action suggests the intended one.
+        
+        This test verifies that:
+        - The action is still denied as undefined
+        - Close spellings of known actions are suggested
+        """
+        result = validator.validate("crete", "Order", "o1", {"role": "Customer"})
+        
+        assert result.allowed is False
+        assert "not defined" in result.reason
+        assert "create" in result.suggested_actions
+        assert validator.validate("zzz", "Order", "o1", {}).suggested_actions == []
+    
+    def test_validate_many_matches_validate(self, validator):
+        """
+        Test that batch validation gives the same results as one-by-one calls.
+        
+        This test verifies that:
+        - Results come back in request order
+        - Each result equals the corresponding validate() result
+        - Unloaded validators raise like validate()
+        """
+        requests = [
+            ("create", "Order", "o1"),
+            ("cancel", "Order", "o2"),
+            ("crete", "Order", "o3"),
+            ("create", "Order", "o4"),
+            ("delete", "Spaceship", "s1"),
+        ]
+        context = {"role": "Customer", "user_id": "u1"}
+        
+        results = validator.validate_many(requests, context)
+        
+        assert len(results) == len(requests)
+        for (action, entity, entity_id), result in zip(requests, results):
+            assert result == validator.validate(action, entity, entity_id, context)
+        
+        unloaded = OntologyValidator.__new__(OntologyValidator)
+        unloaded._loaded = False
+        unloaded.graph = None
+        with pytest.raises(RuntimeError, match="Ontology not loaded"):
+            unloaded.validate_many(requests, context)
+    
     def test_validate_with_empty_context(self, validator):
         """
         Test validation with empty context dictionary.
@@ -493,6 +740,22 @@ class TestGetAllowedActions:
         assert isinstance(actions, list)
         # May be empty or contain actions depending on ontology structure
     
+    def test_get_allowed_actions_is_memoized(self, validator):
+        """
+        Test that allowed actions are computed once per entity spelling.
+        
+        This test verifies that:
+        - Repeated queries are answered from the memo
+        - Callers get their own list each time
+        """
+        first = validator.get_allowed_actions("Order", {})
+        assert validator._allowed_actions_cache["order"] == tuple(first)
+        
+        first.append("mutated")
+        with patch.object(validator, "_find_actions_for_entity_simple", side_effect=AssertionError("not memoized")):
+            second = validator.get_allowed_actions(" order ", {"role": "Customer"})
+        assert "mutated" not in second
+    
     def test_get_allowed_actions_without_loaded_ontology(self):
         """
         Test that get_allowed_actions fails gracefully when ontology is not loaded.
@@ -548,6 +811,37 @@ class TestExplainDenial:
         assert len(explanation) > 0
         # Should contain information about the denial
     
+    def test_explain_denial_branches(self):
+        """
+        Test each structured denial branch against a small in-memory ontology.
+        
+        This test verifies that:
+        - Role, entity and action mismatches are told apart
+        - Allowed roles, entities and actions are listed once each
+        """
+        from rdflib import Namespace, RDF
+        from rdflib.namespace import OWL
+        
+        ex = Namespace("http://example.org/h#")
+        graph = Graph()
+        graph.add((ex.h, RDF.type, OWL.Ontology))
+        for name in ["DoctorReadMedicalRecord", "NurseReadMedicalRecord",
+                     "DoctorReadLabResult", "DoctorPrescribeMedication"]:
+            graph.add((ex[name], RDF.type, ex.Action))
+        validator = OntologyValidator.from_graph(graph, "memory.owl")
+        
+        denial = validator._explain_denial_enhanced("read", "medicalrecord", "patient")
+        assert denial["metadata"]["constraint_type"] == "role_mismatch"
+        assert sorted(denial["metadata"]["allowed_roles"]) == ["doctor", "nurse"]
+        
+        denial = validator._explain_denial_enhanced("read", "invoice", "doctor")
+        assert denial["metadata"]["constraint_type"] == "entity_mismatch"
+        assert sorted(denial["metadata"]["allowed_entities"]) == ["labresult", "medicalrecord"]
+        
+        denial = validator._explain_denial_enhanced("write", "invoice", "doctor")
+        assert denial["metadata"]["constraint_type"] == "action_not_allowed"
+        assert sorted(denial["metadata"]["allowed_actions"]) == ["prescribe", "read"]
+    
     def test_explain_denial_without_loaded_ontology(self):
         """
         Test that explain_denial fails gracefully when ontology is not loaded.
@@ -730,6 +1024,119 @@ class TestIntegration:
         assert all(r.metadata['entity_id'] == f"order_{i}" for i, r in enumerate(results))
         assert validator._loaded is True  # Validator should still be loaded
     
+    def test_rule_lookups_are_memoized(self, validator):
+        """
+        Test that repeated validations reuse memoized rule lookups.
+        
+        This test verifies that:
+        - Rule matches are memoized per (action, entity, role)
+        - Memoized results give the same decisions
+        - Clearing the memos empties the tables
+        """
+        first = validator.validate("create", "Order", "o1", {"role": "Guest"})
+        assert ("create", "order", "guest") in validator._match_cache
+        
+        with patch.object(validator, "_scan_matching_rules", side_effect=AssertionError("not memoized")):
+            second = validator.validate("create", "Order", "o2", {"role": "Guest"})
+        
+        assert second.allowed == first.allowed
+        assert second.reason == first.reason
+        
+        validator._clear_memos()
+        assert validator._match_cache == {}
+    
+    def test_validation_decisions_are_memoized(self, validator):
+        """
+        Test that repeated validations reuse the memoized decision.
+        
+        This test verifies that:
+        - Identical requests skip the decision logic
+        - Per-request metadata (entity_id, context) stays fresh
+        - Results do not share mutable metadata with the memo
+        """
+        first = validator.validate("create", "Order", "o1", {"role": "Guest"})
+        
+        with patch.object(validator, "_decide", side_effect=AssertionError("not memoized")):
+            second = validator.validate("create", "Order", "o2", {"role": "guest", "session": 7})
+        
+        assert second.allowed == first.allowed
+        assert second.reason == first.reason
+        assert second.metadata["entity_id"] == "o2"
+        assert second.metadata["context"] == {"role": "guest", "session": 7}
+        
+        first.suggested_actions.append("mutated")
+        first.metadata["validation_passed"] = "mutated"
+        third = validator.validate("create", "Order", "o3", {"role": "Guest"})
+        assert "mutated" not in third.suggested_actions
+        assert third.metadata.get("validation_passed") != "mutated"
+    
+    def test_parse_rule_name_is_memoized(self, validator):
+        """
+        Test that rule names are split once and then served from the memo.
+        """
+        expected = ('doctor', 'read', 'ownmedicalrecord')
+        assert validator._parse_rule_name('DoctorReadOwnMedicalRecordRule') == expected
+        assert validator._rule_name_cache['DoctorReadOwnMedicalRecordRule'] == expected
+        
+        with patch.object(OntologyValidator, '_RULE_NAME_RE') as rule_name_re:
+            rule_name_re.match.side_effect = AssertionError("not memoized")
+            assert validator._parse_rule_name('DoctorReadOwnMedicalRecordRule') == expected
+
+    def test_rule_names_are_interned(self, validator):
+        """
+        Test that parsed rule names are interned like their components.
+        """
+        for rule in validator._parsed_rules:
+            assert rule.name is sys.intern(rule.name)
+
+    @pytest.mark.parametrize("name,expected", [
+        ("LabTechnicianViewLabResult", ("labtechnician", "view", "labresult")),
+        ("LabTechViewLabResult", ("labtech", "view", "labresult")),
+        ("CreateOrderAction", (None, "create", "order")),
+        ("DoctorPermission", ("doctor", None, None)),
+        ("SomethingElse", (None, None, "somethingelse")),
+    ])
+    def test_parse_rule_name(self, validator, name, expected):
+        """
+        Test that rule names split into the longest role and action prefixes.
+        """
+        assert validator._parse_rule_name(name) == expected
+    
+    def test_rule_index_does_not_precompute_matches(self, sample_ontology_path):
+        """
+        Test that parsing builds the rule index without running rule matching.
+        
+        This test verifies that:
+        - Loading an ontology never calls the rule scan
+        - Matches are computed on first request and then memoized
+        """
+        with patch.object(OntologyValidator, "_scan_matching_rules", side_effect=AssertionError("scanned at load")):
+            validator = OntologyValidator(sample_ontology_path)
+        
+        assert validator._match_cache == {}
+        assert validator.validate("create", "Order", "o1", {"role": "Admin"}).allowed
+        assert ("create", "order", "admin") in validator._match_cache
+    
+    @pytest.mark.parametrize("ontology", ["ecommerce.owl", "healthcare.owl", "finance.owl"])
+    def test_rule_columns_agree_with_matches(self, ontology):
+        """
+        Test that the column scan selects exactly the rules ParsedRule.matches
+        accepts, ordered as a stable sort by exact entity and exact role.
+        """
+        path = Path(__file__).parent.parent / "examples" / "ontologies" / ontology
+        validator = OntologyValidator(str(path))
+        rules = validator._parsed_rules
+        entities = {r.entity for r in rules if r.entity} | {"order", "record", "unknown", ""}
+        roles = {r.role for r in rules if r.role} | {"admin", "labtech", "nobody", ""}
+        
+        for action, action_rules in validator._rules_by_action.items():
+            for entity in entities:
+                for role in roles:
+                    expected = [r for r in action_rules if r.matches(action, entity, role)]
+                    expected.sort(key=lambda r: (r.entity == entity, r.role == role), reverse=True)
+                    found = validator._scan_matching_rules(action, entity, role)
+                    assert found == expected, (action, entity, role)
+    
     def test_validator_reuse_after_error(self, validator):
         """
         Test that validator can be reused after handling an error.